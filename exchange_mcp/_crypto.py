@@ -0,0 +1,99 @@
+"""Credential encryption shared by login.py and the MCP login tool.
+
+Stored credentials and session cookies are encrypted with a key derived
+from the master password (PBKDF2-HMAC-SHA256, 480,000 iterations) and
+wrapped with Fernet. Files live in the project root next to login.py.
+``cryptography`` is imported on first use, keeping this module cheap to import.
+"""
+
+import base64
+import hashlib
+import hmac
+import os
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+CREDS_FILE = _PROJECT_ROOT / ".credentials.enc"
+SALT_FILE = _PROJECT_ROOT / ".salt"
+
+
+# Derived keys that have already decrypted something, keyed on an HMAC of
+# the password under the salt so the password itself is never retained.
+# PBKDF2 is slow by design and the login tool derives the same key on every
+# call of the 2FA flow.
+_KEY_CACHE: dict[bytes, bytes] = {}
+_KEY_CACHE_SIZE = 4
+
+
+def _key_cache_id(password: str, salt: bytes) -> bytes:
+    return hmac.new(salt, password.encode(), hashlib.sha256).digest()
+
+
+def remember_key(password: str, salt: bytes, key: bytes) -> None:
+    """Cache ``key`` for (password, salt); call only after it decrypted successfully."""
+    if len(_KEY_CACHE) >= _KEY_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        _KEY_CACHE.pop(next(iter(_KEY_CACHE)))
+    _KEY_CACHE[_key_cache_id(password, salt)] = key
+
+
+def clear_key_cache() -> None:
+    """Forget every cached derived key."""
+    _KEY_CACHE.clear()
+
+
+def get_key(password: str, salt: bytes) -> bytes:
+    """Derive encryption key from password, reusing a remembered key if any."""
+    cached = _KEY_CACHE.get(_key_cache_id(password, salt))
+    if cached is not None:
+        return cached
+
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=480000,
+    )
+    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+
+
+def encrypt_credentials(username: str, password: str, master_password: str) -> None:
+    """Encrypt and save credentials with a fresh salt."""
+    from cryptography.fernet import Fernet
+
+    clear_key_cache()
+    salt = os.urandom(16)
+    key = get_key(master_password, salt)
+    f = Fernet(key)
+
+    encrypted = f.encrypt(f"{username}:{password}".encode())
+
+    SALT_FILE.write_bytes(salt)
+    CREDS_FILE.write_bytes(encrypted)
+    os.chmod(SALT_FILE, 0o600)
+    os.chmod(CREDS_FILE, 0o600)
+
+
+def decrypt_credentials(master_password: str) -> tuple:
+    """Decrypt and return (username, password), or (None, None) on failure."""
+    if not CREDS_FILE.exists() or not SALT_FILE.exists():
+        return None, None
+
+    from cryptography.fernet import Fernet
+
+    salt = SALT_FILE.read_bytes()
+    encrypted = CREDS_FILE.read_bytes()
+    key = get_key(master_password, salt)
+    f = Fernet(key)
+
+    try:
+        data = f.decrypt(encrypted).decode()
+        username, password = data.split(":", 1)
+    except Exception:
+        return None, None
+    remember_key(master_password, salt, key)
+    return username, password
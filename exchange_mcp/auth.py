@@ -1,36 +1,97 @@
 """Shared login logic for Exchange MCP.
 
-Reuses crypto functions from login.py and provides an async Playwright-based
-login function for use by the MCP login tool.
+Reuses the credential crypto from exchange_mcp._crypto and provides an async Playwright-based
+login function for use by the MCP login tool. ``cryptography`` and
+``playwright`` are imported at call sites, so importing this module is cheap.
 """
 
 import asyncio
+import base64
 import os
-import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from cryptography.fernet import Fernet
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
-# Ensure login.py (project root) is importable regardless of cwd
-_project_root = str(Path(__file__).resolve().parent.parent)
-if _project_root not in sys.path:
-    sys.path.insert(0, _project_root)
+from exchange_mcp._crypto import (  # noqa: F401 (re-exported for tools.auth)
+    CREDS_FILE,
+    SALT_FILE,
+    get_key,
+    remember_key,
+    encrypt_credentials,
+    decrypt_credentials,
+)
+from exchange_mcp.owa_client import ENCRYPTED_COOKIE_MAGIC
 
-from login import CREDS_FILE, SALT_FILE, get_key, encrypt_credentials, decrypt_credentials
+
+# Playwright selectors used during the login flow (English + Russian UI)
+_CONTINUE_BTN = 'button:has-text("Continue"), button:has-text("Продолжить")'
+_CHOICE_H1 = 'h1:has-text("Choose"), h1:has-text("Выберите")'
+_OWA_ARIA = '[aria-label*="Outlook"], [aria-label*="Почта"]'
+
+# How long to wait for the user to approve the 2FA push
+_APPROVAL_TIMEOUT_MS = 90_000
 
 
 # ------------------------------------------------------------------
 # Cookie encryption (same master password / salt as credentials)
 # ------------------------------------------------------------------
 
+_SALT_CACHE = {"mtime_ns": 0, "bytes": b""}
+
+
+def _read_salt() -> bytes:
+    """Read the salt file, reusing the cached bytes while its mtime is unchanged."""
+    mtime = SALT_FILE.stat().st_mtime_ns
+    if mtime != _SALT_CACHE["mtime_ns"]:
+        _SALT_CACHE["bytes"] = SALT_FILE.read_bytes()
+        _SALT_CACHE["mtime_ns"] = mtime
+    return _SALT_CACHE["bytes"]
+
+
+# Encrypted cookie file layout: magic (4) + nonce (12) + AES-GCM ciphertext.
+# Files without the magic are legacy Fernet tokens and are still readable.
+_COOKIE_NONCE_LEN = 12
+_COOKIE_AAD = b"cookie-v1"
+
+
+def _get_fernet(key: bytes) -> "Fernet":
+    """Build the legacy cookie Fernet from the derived master key."""
+    from cryptography.fernet import Fernet
+
+    return Fernet(key)
+
+
+def _get_cookie_cipher(key: bytes) -> "AESGCM":
+    """Build the AES-256-GCM cookie cipher from the derived master key.
+
+    The PBKDF2 master key is passed through HKDF so the cookie key is
+    distinct from the Fernet key protecting the stored credentials.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+    master_key = base64.urlsafe_b64decode(key)
+    cookie_key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"exchange-mcp session cookies",
+    ).derive(master_key)
+    return AESGCM(cookie_key)
+
+
 def encrypt_cookie_file(cookies_str: str, master_password: str, cookie_file: Path) -> None:
     """Encrypt session cookies and write to disk."""
     if not SALT_FILE.exists():
         raise FileNotFoundError("Salt file not found. Set up credentials first.")
-    salt = SALT_FILE.read_bytes()
-    key = get_key(master_password, salt)
-    f = Fernet(key)
-    cookie_file.write_bytes(f.encrypt(cookies_str.encode()))
+    cipher = _get_cookie_cipher(get_key(master_password, _read_salt()))
+    nonce = os.urandom(_COOKIE_NONCE_LEN)
+    ciphertext = cipher.encrypt(nonce, cookies_str.encode(), _COOKIE_AAD)
+    cookie_file.write_bytes(ENCRYPTED_COOKIE_MAGIC + nonce + ciphertext)
     os.chmod(cookie_file, 0o600)
 
 
@@ -38,19 +99,98 @@ def decrypt_cookie_file(master_password: str, cookie_file: Path) -> str | None:
     """Decrypt session cookies from disk. Returns None on failure."""
     if not cookie_file.exists() or not SALT_FILE.exists():
         return None
-    salt = SALT_FILE.read_bytes()
+    raw = cookie_file.read_bytes()
+    salt = _read_salt()
     key = get_key(master_password, salt)
-    f = Fernet(key)
     try:
-        return f.decrypt(cookie_file.read_bytes()).decode()
+        if raw.startswith(ENCRYPTED_COOKIE_MAGIC):
+            start = len(ENCRYPTED_COOKIE_MAGIC)
+            nonce = raw[start:start + _COOKIE_NONCE_LEN]
+            ciphertext = raw[start + _COOKIE_NONCE_LEN:]
+            cipher = _get_cookie_cipher(key)
+            cookies = cipher.decrypt(nonce, ciphertext, _COOKIE_AAD).decode()
+        else:
+            cookies = _get_fernet(key).decrypt(raw).decode()
     except Exception:
         return None
+    remember_key(master_password, salt, key)
+    return cookies
+
+
+# ------------------------------------------------------------------
+# Shared browser (launched once, reused across logins)
+# ------------------------------------------------------------------
+
+_PW = {"pw": None, "browser": None, "lock": asyncio.Lock()}
+
+
+async def _get_browser():
+    """Return the shared headless Chromium, launching it on first use.
+
+    Launching Chromium dominates login latency, so a single browser is kept
+    alive for the server lifetime and each login opens its own context on it.
+    Relaunches if the browser has crashed or disconnected.
+    """
+    from playwright.async_api import async_playwright
+
+    async with _PW["lock"]:
+        browser = _PW["browser"]
+        if browser is not None and browser.is_connected():
+            return browser
+        if _PW["pw"] is None:
+            _PW["pw"] = await async_playwright().start()
+        browser = await _PW["pw"].chromium.launch(headless=True)
+        _PW["browser"] = browser
+        return browser
+
+
+async def _acquire_context():
+    """Open a fresh context on the shared browser for one login."""
+    browser = await _get_browser()
+    return await browser.new_context()
+
+
+async def _release_context(context) -> None:
+    """Close a login context.
+
+    Contexts are not reused: besides cookies, a login leaves localStorage,
+    sessionStorage, IndexedDB, the HTTP cache and service workers behind,
+    and stale SSO/MSAL state there can change the next login flow. A new
+    context is cheap next to launching the browser, which stays shared.
+    """
+    try:
+        await context.close()
+    except Exception:
+        pass
+
+
+async def close_browser() -> None:
+    """Close the shared browser and stop Playwright (called on shutdown)."""
+    async with _PW["lock"]:
+        browser, pw = _PW["browser"], _PW["pw"]
+        _PW["browser"] = None
+        _PW["pw"] = None
+        try:
+            if browser is not None:
+                await browser.close()
+        finally:
+            if pw is not None:
+                await pw.stop()
 
 
 # ------------------------------------------------------------------
 # Async browser login
 # ------------------------------------------------------------------
 
+async def _progress_ticker(info, interval: int = 15) -> None:
+    """Emit a 'still waiting' status every `interval` seconds until cancelled."""
+    elapsed = 0
+    while True:
+        await asyncio.sleep(interval)
+        elapsed += interval
+        await info(f"Still waiting... ({elapsed}s)")
+
+
 async def perform_login(
     username: str,
     password: str,
@@ -72,8 +212,6 @@ async def perform_login(
         {"success": True, "cookies": "name=val\\n..."} on success,
         {"success": False, "error": "..."} on failure.
     """
-    from playwright.async_api import async_playwright
-
     owa_host = owa_url.replace("https://", "").replace("http://", "").rstrip("/")
 
     async def _info(msg: str):
@@ -82,113 +220,105 @@ async def perform_login(
 
     await _info(f"Logging in as {username}...")
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
+    try:
+        context = await _acquire_context()
+    except Exception as e:
+        return {"success": False, "error": f"Could not start browser: {e}"}
+
+    try:
         page = await context.new_page()
 
-        try:
-            # Step 1: Navigate to OWA (redirects to SSO)
-            await page.goto(f"{owa_url}/owa/", wait_until="networkidle")
-
-            # Step 2: Fill credentials and submit
-            await page.fill('input[name="username"]', username)
-            await page.fill('input[name="password"]', password)
-            try:
-                btn = page.locator(
-                    'button:has-text("Continue"), button:has-text("Продолжить")'
-                ).first
-                await btn.click(timeout=5000)
-            except Exception:
-                await page.press('input[name="password"]', "Enter")
-            await page.wait_for_load_state("networkidle")
+        # Step 1: Navigate to OWA (redirects to SSO)
+        await page.goto(f"{owa_url}/owa/", wait_until="networkidle")
 
-            await _info("Credentials submitted, selecting 2FA method...")
+        # Step 2: Fill credentials and submit
+        await page.fill('input[name="username"]', username)
+        await page.fill('input[name="password"]', password)
+        try:
+            btn = page.locator(_CONTINUE_BTN).first
+            await btn.click(timeout=5000)
+        except Exception:
+            await page.press('input[name="password"]', "Enter")
+        await page.wait_for_load_state("networkidle")
 
-            # Step 3: Click 2FA authenticator button (skip nav/menu buttons)
-            try:
-                # Look for a heading that indicates the 2FA choice screen
-                await page.wait_for_selector(
-                    'h1:has-text("Choose"), h1:has-text("Выберите")',
-                    timeout=10000,
-                )
-                # Pick the first button inside the choices container (after the heading),
-                # skipping nav/menu chrome buttons.
-                auth_btn = page.locator("h1 ~ div button").first
-                await auth_btn.click(timeout=5000)
-                await page.wait_for_load_state("networkidle")
-            except Exception as e:
-                await _info(f"Could not find 2FA button: {e}")
-
-            # Step 4: Wait for mobile approval
-            await _info("Waiting for mobile approval... Check your 2FA app!")
-            success = False
-            last_url = ""
-
-            for i in range(90):
-                await asyncio.sleep(1)
-
-                try:
-                    url = page.url
-
-                    if url != last_url:
-                        await _info(f"URL changed: {url[:80]}...")
-                        last_url = url
-
-                    if owa_host in url and "ofam" not in url and "adfs" not in url:
-                        await _info("OWA detected! Waiting for page to load...")
-                        await page.wait_for_load_state("load", timeout=15000)
-                        success = True
-                        break
-
-                    try:
-                        if (
-                            await page.locator(
-                                '[aria-label*="Outlook"], [aria-label*="Почта"]'
-                            ).count()
-                            > 0
-                        ):
-                            await _info("OWA elements detected!")
-                            success = True
-                            break
-                    except Exception:
-                        pass
-
-                    if i > 0 and i % 15 == 0:
-                        await _info(f"Still waiting... ({i}s)")
-
-                except Exception as e:
-                    err_str = str(e).lower()
-                    if any(
-                        kw in err_str
-                        for kw in ("navigation", "destroyed", "target closed")
-                    ):
-                        await _info("Navigation in progress...")
-                        try:
-                            await page.wait_for_load_state("load", timeout=15000)
-                            url = page.url
-                            if owa_host in url and "ofam" not in url:
-                                success = True
-                                break
-                        except Exception:
-                            pass
-                    else:
-                        await _info(f"Error: {e}")
-
-            if success:
-                cookies = await context.cookies()
-                cookies_str = "\n".join(
-                    f"{c['name']}={c['value']}" for c in cookies
-                )
-                await _info("Login successful.")
-                return {"success": True, "cookies": cookies_str}
-            else:
-                return {
-                    "success": False,
-                    "error": "2FA approval not received within 90 seconds.",
-                }
+        await _info("Credentials submitted, selecting 2FA method...")
 
+        # Step 3: Click 2FA authenticator button (skip nav/menu buttons)
+        try:
+            # Look for a heading that indicates the 2FA choice screen
+            await page.wait_for_selector(_CHOICE_H1, timeout=10000)
+            # Pick the first button inside the choices container (after the heading),
+            # skipping nav/menu chrome buttons.
+            auth_btn = page.locator("h1 ~ div button").first
+            await auth_btn.click(timeout=5000)
+            await page.wait_for_load_state("networkidle")
         except Exception as e:
-            return {"success": False, "error": str(e)}
+            await _info(f"Could not find 2FA button: {e}")
+
+        # Step 4: Wait for mobile approval. A framenavigated listener flags
+        # arrival at OWA and is raced against an element wait, so nothing
+        # polls the page while the user approves the push.
+        await _info("Waiting for mobile approval... Check your 2FA app!")
+
+        def _is_owa_url(url: str) -> bool:
+            return owa_host in url and "ofam" not in url and "adfs" not in url
+
+        owa_reached = asyncio.Event()
+
+        def _on_nav(frame) -> None:
+            if frame is page.main_frame and _is_owa_url(frame.url):
+                owa_reached.set()
+
+        page.on("framenavigated", _on_nav)
+        if _is_owa_url(page.url):
+            owa_reached.set()
+
+        waiters = {
+            asyncio.create_task(owa_reached.wait()),
+            asyncio.create_task(
+                page.wait_for_selector(_OWA_ARIA, timeout=_APPROVAL_TIMEOUT_MS)
+            ),
+        }
+        ticker = asyncio.create_task(_progress_ticker(_info))
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _APPROVAL_TIMEOUT_MS / 1000
+        success = False
+        try:
+            # Keep waiting on the other task if one fails early (e.g. a
+            # selector wait torn down by a navigation).
+            while waiters and not success:
+                done, waiters = await asyncio.wait(
+                    waiters,
+                    timeout=max(deadline - loop.time(), 0),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+                success = any(t.exception() is None for t in done)
         finally:
-            await browser.close()
+            ticker.cancel()
+            for t in waiters:
+                t.cancel()
+            page.remove_listener("framenavigated", _on_nav)
+
+        if success and owa_reached.is_set():
+            await _info("OWA detected! Waiting for page to load...")
+            await page.wait_for_load_state("load", timeout=15000)
+
+        if success:
+            cookies = await context.cookies()
+            cookies_str = "\n".join(
+                [f"{c['name']}={c['value']}" for c in cookies]
+            )
+            await _info("Login successful.")
+            return {"success": True, "cookies": cookies_str}
+        else:
+            return {
+                "success": False,
+                "error": "2FA approval not received within 90 seconds.",
+            }
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    finally:
+        await _release_context(context)
@@ -1,7 +1,9 @@
 """Return type definitions for MCP tools.
 
 Uses TypedDict for lightweight structured return types without
-requiring Pydantic at the model layer.
+requiring Pydantic at the model layer. TypedDicts exist only for static
+typing: instances are plain dicts, so tools can build and serialize them
+directly with no conversion step or extra runtime dependency.
 """
 
 from typing import TypedDict
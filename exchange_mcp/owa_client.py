@@ -4,9 +4,46 @@ Extracts and unifies the duplicated request/cookie/session patterns
 from all standalone scripts into a single reusable client.
 """
 
+import asyncio
+import json
 import os
+import re
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote_from_bytes, unquote
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_cookie_lines(raw: str) -> dict[str, str]:
+    """Parse 'name=value' lines into a dict, ignoring lines without '='."""
+    cookies: dict[str, str] = {}
+    for line in raw.splitlines():
+        name, sep, value = line.partition("=")
+        if sep:
+            cookies[name] = value
+    return cookies
 
 
 class SessionExpiredError(Exception):
@@ -14,6 +51,41 @@ class SessionExpiredError(Exception):
     pass
 
 
+# Content-Disposition filename parsing (RFC 5987 filename*= first, then filename=)
+_FILENAME_STAR_RE = re.compile(r"filename\*=(?:UTF-8''|utf-8'')(.+?)(?:;|$)")
+_FILENAME_RE = re.compile(r'filename="?([^";]+)"?')
+
+
+# JSON punctuation that can travel unescaped in the X-OWA-UrlPostData header.
+# OWA URL-decodes the header, so leaving these raw is equivalent and skips
+# most of quote()'s per-byte work. '%', '+', spaces and non-ASCII still escape.
+_HEADER_SAFE = "/{}[]:,\"'.-_@"
+
+
+# Prefix of cookie files written by exchange_mcp.auth.encrypt_cookie_file
+ENCRYPTED_COOKIE_MAGIC = b"XGC1"
+
+# Read-only request header shared by the payloads built in this module
+_HEADER_2013 = {
+    "__type": "JsonRequestHeaders:#Exchange",
+    "RequestServerVersion": "Exchange2013",
+}
+
+# Read size for streamed attachment downloads
+_DOWNLOAD_CHUNK = 64 * 1024
+
+# How long a custom folder name -> ID lookup stays cached (seconds)
+_FOLDER_CACHE_TTL = 300
+
+# ResolveNames result cache: entry lifetime (seconds) and max entries.
+# Directory entries change rarely; the cache is also dropped on re-login.
+_RESOLVE_CACHE_TTL = 3600
+_RESOLVE_CACHE_SIZE = 1024
+
+# Max ResolveNames requests in flight for resolve_names_many
+_RESOLVE_CONCURRENCY = 8
+
+
 # Map common folder names (English + Russian) to OWA distinguished folder IDs
 DISTINGUISHED_FOLDERS = {
     "inbox": "inbox",
@@ -33,6 +105,69 @@ DISTINGUISHED_FOLDERS = {
 }
 
 
+# Request bodies for the lookups below are constant apart from at most one
+# string, so they are serialized once here instead of on every call.
+_DISTINGUISHED_IDS = tuple(sorted(set(DISTINGUISHED_FOLDERS.values())))
+
+_GET_DISTINGUISHED_FOLDERS_BODY = _json_dumps({
+    "__type": "GetFolderJsonRequest:#Exchange",
+    "Header": _HEADER_2013,
+    "Body": {
+        "__type": "GetFolderRequest:#Exchange",
+        "FolderShape": {
+            "__type": "FolderResponseShape:#Exchange",
+            "BaseShape": "IdOnly",
+        },
+        "FolderIds": [
+            {"__type": "DistinguishedFolderId:#Exchange", "Id": dist_id}
+            for dist_id in _DISTINGUISHED_IDS
+        ],
+    },
+})
+
+_FIND_ROOT_FOLDERS_BODY = _json_dumps({
+    "__type": "FindFolderJsonRequest:#Exchange",
+    "Header": _HEADER_2013,
+    "Body": {
+        "__type": "FindFolderRequest:#Exchange",
+        "FolderShape": {
+            "__type": "FolderResponseShape:#Exchange",
+            "BaseShape": "Default",
+        },
+        "ParentFolderIds": [
+            {
+                "__type": "DistinguishedFolderId:#Exchange",
+                "Id": "msgfolderroot",
+            }
+        ],
+        "Traversal": "Shallow",
+        "Paging": {
+            "__type": "IndexedPageView:#Exchange",
+            "BasePoint": "Beginning",
+            "Offset": 0,
+            "MaxEntriesReturned": 200,
+        },
+    },
+})
+
+# ResolveNames bodies keyed by full_contact; the query replaces the placeholder
+_QUERY_PLACEHOLDER = _json_dumps("__QUERY__")
+_RESOLVE_NAMES_TEMPLATES = {
+    full_contact: _json_dumps({
+        "__type": "ResolveNamesJsonRequest:#Exchange",
+        "Header": _HEADER_2013,
+        "Body": {
+            "__type": "ResolveNamesRequest:#Exchange",
+            "UnresolvedEntry": "__QUERY__",
+            "ReturnFullContactData": full_contact,
+            "SearchScope": "ActiveDirectoryContacts",
+            "ContactDataShape": "AllProperties" if full_contact else "Default",
+        },
+    })
+    for full_contact in (True, False)
+}
+
+
 class OWAClient:
     """HTTP client for OWA (Outlook Web Access) JSON API.
 
@@ -60,9 +195,38 @@ class OWAClient:
             )
         self._cookies: dict[str, str] = {}
         self._canary: str = ""
-        self._session = requests.Session()
+        self._session = self._make_session()
         self._loaded = False
         self.user_email: str = ""
+        # Lookup caches (cleared whenever a new session is loaded)
+        self._distinguished_ids: dict[str, str] = {}
+        self._distinguished_prefetched = False
+        self._custom_folder_ids: dict[str, tuple[str, float]] = {}
+        # ResolveNames cache: (query, full_contact) -> (timestamp, resolutions)
+        self._resolve_cache: dict[tuple[str, bool], tuple[float, list[dict]]] = {}
+        # resolve_names runs on worker threads (resolve_names_many, sync tools)
+        self._resolve_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _make_session() -> requests.Session:
+        """Create a Session with a keep-alive pool and the headers every call sends.
+
+        Tools can fan out several requests at once, so the pool is larger
+        than requests' default of 10 to avoid re-handshaking TLS.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, pool_block=False)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Content-Type": "application/json; charset=utf-8",
+            "X-Requested-With": "XMLHttpRequest",
+        })
+        return session
+
+    def close(self) -> None:
+        """Close the pooled keep-alive connections (called on server shutdown)."""
+        self._session.close()
 
     # ------------------------------------------------------------------
     # Cookie / session helpers
@@ -75,28 +239,21 @@ class OWAClient:
                 f"Cookie file not found: {self.cookie_file}. Call the login tool first."
             )
 
-        raw = self.cookie_file.read_text().strip()
+        data = self.cookie_file.read_bytes()
 
-        # Detect encrypted cookie file (Fernet tokens start with gAAAAA)
-        if raw.startswith("gAAAAA"):
+        # Detect encrypted cookie file (AES-GCM magic, or legacy Fernet gAAAAA)
+        if data.startswith(ENCRYPTED_COOKIE_MAGIC) or data.lstrip().startswith(b"gAAAAA"):
             raise SessionExpiredError(
                 "Cookie file is encrypted. Call the login tool to decrypt and restore the session."
             )
 
-        cookies: dict[str, str] = {}
-        for line in raw.split("\n"):
-            if "=" in line:
-                name, value = line.split("=", 1)
-                cookies[name] = value
+        raw = data.decode("utf-8", "replace").strip()
 
+        cookies = _parse_cookie_lines(raw)
         if not cookies:
             raise SessionExpiredError("Cookie file is empty. Call the login tool first.")
 
-        self._cookies = cookies
-        self._canary = cookies.get("X-OWA-CANARY", "")
-        self._session = requests.Session()
-        self._session.cookies.update(cookies)
-        self._loaded = True
+        self._install_cookies(cookies)
 
     def _ensure_loaded(self) -> None:
         """Load cookies on first use."""
@@ -111,7 +268,6 @@ class OWAClient:
         """
         old_cookies = self._cookies
         old_canary = self._canary
-        old_session = self._session
         old_loaded = self._loaded
         try:
             self._loaded = False
@@ -120,7 +276,6 @@ class OWAClient:
             # Restore previous state to avoid corrupting a valid in-memory session
             self._cookies = old_cookies
             self._canary = old_canary
-            self._session = old_session
             self._loaded = old_loaded
             raise
 
@@ -130,28 +285,33 @@ class OWAClient:
         Used by the login tool to inject cookies directly into memory
         without writing plaintext to disk.
         """
-        cookies: dict[str, str] = {}
-        for line in cookies_str.strip().split("\n"):
-            if "=" in line:
-                name, value = line.split("=", 1)
-                cookies[name] = value
-
+        cookies = _parse_cookie_lines(cookies_str.strip())
         if not cookies:
             raise SessionExpiredError("No cookies in provided data.")
 
+        self._install_cookies(cookies)
+
+    def _install_cookies(self, cookies: dict[str, str]) -> None:
+        """Swap in a new cookie set, keeping the session's connection pool."""
         self._cookies = cookies
         self._canary = cookies.get("X-OWA-CANARY", "")
-        self._session = requests.Session()
+        self._session.cookies.clear()
         self._session.cookies.update(cookies)
         self._loaded = True
+        self.clear_folder_cache()
+        self.clear_resolve_cache()
 
     # ------------------------------------------------------------------
     # Core request method
     # ------------------------------------------------------------------
 
-    def request(self, action: str, payload: dict, *, timeout: int = 30) -> dict:
+    def request(
+        self, action: str, payload: dict | bytes, *, timeout: int = 30
+    ) -> dict:
         """POST to /owa/service.svc?action={action}&EP=1&ID=-1&AC=1.
 
+        ``payload`` is a dict to serialize, or an already-serialized JSON body.
+
         On session expiry (401, 440, or text/html response), reloads cookies
         once and retries. If that also fails, raises SessionExpiredError.
 
@@ -176,7 +336,19 @@ class OWAClient:
         # Should not reach here, but just in case
         raise SessionExpiredError("Session expired. Run login.py to login again.")
 
-    def _do_request(self, action: str, payload: dict, *, timeout: int = 30) -> dict:
+    async def arequest(
+        self, action: str, payload: dict | bytes, *, timeout: int = 30
+    ) -> dict:
+        """Awaitable variant of ``request()`` for async callers.
+
+        Runs the blocking call in a worker thread so the event loop stays
+        responsive; concurrent calls share the session's keep-alive pool.
+        """
+        return await asyncio.to_thread(self.request, action, payload, timeout=timeout)
+
+    def _do_request(
+        self, action: str, payload: dict | bytes, *, timeout: int = 30
+    ) -> dict:
         """Execute a single OWA API request (no retry)."""
         url = f"{self.owa_url}/owa/service.svc?action={action}&EP=1&ID=-1&AC=1"
 
@@ -184,31 +356,25 @@ class OWAClient:
         # over the session cookie jar, which can hold stale domain-less entries.
         canary = self._canary or self._session.cookies.get("X-OWA-CANARY")
 
-        headers = {
-            "Content-Type": "application/json; charset=utf-8",
-            "Action": action,
-            "X-OWA-CANARY": canary,
-            "X-Requested-With": "XMLHttpRequest",
-        }
+        headers = {"Action": action, "X-OWA-CANARY": canary}
+        body = payload if isinstance(payload, bytes) else _json_dumps(payload)
 
         try:
-            resp = self._session.post(url, json=payload, headers=headers, timeout=timeout)
+            resp = self._session.post(url, data=body, headers=headers, timeout=timeout)
         except requests.exceptions.RequestException as exc:
             raise SessionExpiredError(f"Request failed: {exc}") from exc
 
         # Keep cached canary in sync if OWA rotated it
-        new_canary = resp.cookies.get("X-OWA-CANARY")
-        if new_canary:
-            self._canary = new_canary
-            self._session.cookies.set("X-OWA-CANARY", new_canary)
+        self._sync_canary(resp)
 
         # Detect session expiry
         if resp.status_code in (401, 440):
             raise SessionExpiredError("Session expired (HTTP {}).".format(resp.status_code))
 
         if "text/html" in resp.headers.get("Content-Type", ""):
-            # Extract a snippet from HTML for diagnostics (login redirects vs API errors)
-            body_snippet = resp.text[:300] if resp.text else ""
+            # Extract a snippet from HTML for diagnostics (login redirects vs API errors).
+            # Slice the raw bytes first so only the snippet is decoded.
+            body_snippet = resp.content[:300].decode("utf-8", "replace")
             raise SessionExpiredError(
                 f"Session expired or invalid action (HTML response, HTTP {resp.status_code}). "
                 f"Snippet: {body_snippet}"
@@ -216,13 +382,27 @@ class OWAClient:
 
         # Parse JSON
         try:
-            return resp.json()
-        except (ValueError, requests.exceptions.JSONDecodeError) as exc:
+            return _json_loads(resp.content)
+        except ValueError as exc:
             raise SessionExpiredError(
                 f"Unexpected response (HTTP {resp.status_code}). "
                 "Session may have expired."
             ) from exc
 
+    def _sync_canary(self, resp: requests.Response) -> None:
+        """Adopt a rotated X-OWA-CANARY from the response, if it set one.
+
+        OWA rotates the canary rarely, so the raw Set-Cookie header is checked
+        before touching the cookie jars.
+        """
+        set_cookie = resp.headers.get("Set-Cookie")
+        if not set_cookie or "X-OWA-CANARY" not in set_cookie:
+            return
+        new_canary = resp.cookies.get("X-OWA-CANARY")
+        if new_canary:
+            self._canary = new_canary
+            self._session.cookies.set("X-OWA-CANARY", new_canary)
+
     def request_header_payload(
         self, action: str, payload: dict, *, timeout: int = 30
     ) -> dict:
@@ -255,20 +435,15 @@ class OWAClient:
         self, action: str, payload: dict, *, timeout: int = 30
     ) -> dict:
         """Execute a single OWA API request with payload in header."""
-        import json as _json
-        from urllib.parse import quote
-
         url = f"{self.owa_url}/owa/service.svc?action={action}&EP=1&ID=-1&AC=1"
         canary = self._canary or self._session.cookies.get("X-OWA-CANARY")
 
-        url_post_data = quote(_json.dumps(payload, separators=(",", ":")))
+        url_post_data = quote_from_bytes(_json_dumps(payload), safe=_HEADER_SAFE)
 
         headers = {
-            "Content-Type": "application/json; charset=UTF-8",
             "Action": action,
             "X-OWA-CANARY": canary,
             "X-OWA-UrlPostData": url_post_data,
-            "X-Requested-With": "XMLHttpRequest",
         }
 
         try:
@@ -276,10 +451,7 @@ class OWAClient:
         except requests.exceptions.RequestException as exc:
             raise SessionExpiredError(f"Request failed: {exc}") from exc
 
-        new_canary = resp.cookies.get("X-OWA-CANARY")
-        if new_canary:
-            self._canary = new_canary
-            self._session.cookies.set("X-OWA-CANARY", new_canary)
+        self._sync_canary(resp)
 
         if resp.status_code in (401, 440):
             raise SessionExpiredError(
@@ -287,15 +459,15 @@ class OWAClient:
             )
 
         if "text/html" in resp.headers.get("Content-Type", ""):
-            body_snippet = resp.text[:300] if resp.text else ""
+            body_snippet = resp.content[:300].decode("utf-8", "replace")
             raise SessionExpiredError(
                 f"Session expired or invalid action (HTML response, HTTP {resp.status_code}). "
                 f"Snippet: {body_snippet}"
             )
 
         try:
-            return resp.json()
-        except (ValueError, requests.exceptions.JSONDecodeError) as exc:
+            return _json_loads(resp.content)
+        except ValueError as exc:
             raise SessionExpiredError(
                 f"Unexpected response (HTTP {resp.status_code}). "
                 "Session may have expired."
@@ -305,15 +477,15 @@ class OWAClient:
     # File download (attachments)
     # ------------------------------------------------------------------
 
-    def download_file(
+    def _open_download(
         self, attachment_id: str, *, timeout: int = 60
-    ) -> tuple[bytes, str, str]:
-        """Download a file attachment by its AttachmentId.
+    ) -> tuple[requests.Response, str, str]:
+        """Start a streamed GetFileAttachment GET and validate its headers.
 
-        Uses the OWA GetFileAttachment endpoint (direct GET).
+        The body is not read yet; callers must consume and close the response.
 
         Returns:
-            (content_bytes, filename, content_type)
+            (response, filename, content_type)
         """
         self._ensure_loaded()
 
@@ -326,16 +498,18 @@ class OWAClient:
         )
 
         try:
-            resp = self._session.get(url, timeout=timeout)
+            resp = self._session.get(url, timeout=timeout, stream=True)
         except requests.exceptions.RequestException as exc:
             raise SessionExpiredError(f"Download failed: {exc}") from exc
 
         if resp.status_code in (401, 440):
+            resp.close()
             raise SessionExpiredError(
                 f"Session expired (HTTP {resp.status_code})."
             )
 
         if "text/html" in resp.headers.get("Content-Type", ""):
+            resp.close()
             raise SessionExpiredError(
                 "Session expired (HTML response on attachment download)."
             )
@@ -344,21 +518,91 @@ class OWAClient:
         filename = "attachment"
         cd = resp.headers.get("Content-Disposition", "")
         if cd:
-            import re as _re
-            from urllib.parse import unquote
-
             # Try filename*= (RFC 5987) first, then filename=
-            match = _re.search(r"filename\*=(?:UTF-8''|utf-8'')(.+?)(?:;|$)", cd)
+            match = _FILENAME_STAR_RE.search(cd)
             if match:
                 filename = unquote(match.group(1).strip())
             else:
-                match = _re.search(r'filename="?([^";]+)"?', cd)
+                match = _FILENAME_RE.search(cd)
                 if match:
                     filename = unquote(match.group(1).strip())
 
         content_type = resp.headers.get("Content-Type", "application/octet-stream")
 
-        return resp.content, filename, content_type
+        return resp, filename, content_type
+
+    def download_file(
+        self, attachment_id: str, *, timeout: int = 60
+    ) -> tuple[bytes, str, str]:
+        """Download a file attachment by its AttachmentId.
+
+        Uses the OWA GetFileAttachment endpoint (direct GET).
+
+        Returns:
+            (content_bytes, filename, content_type)
+        """
+        resp, filename, content_type = self._open_download(
+            attachment_id, timeout=timeout
+        )
+        buf = bytearray()
+        try:
+            for chunk in resp.iter_content(_DOWNLOAD_CHUNK):
+                buf += chunk
+        except requests.exceptions.RequestException as exc:
+            raise SessionExpiredError(f"Download failed: {exc}") from exc
+        finally:
+            resp.close()
+
+        return bytes(buf), filename, content_type
+
+    def download_file_to(
+        self, attachment_id: str, path: Path, *, timeout: int = 60
+    ) -> tuple[int, str, str]:
+        """Download a file attachment straight to ``path`` in fixed-size chunks.
+
+        Peak memory stays at one chunk regardless of attachment size.
+
+        Returns:
+            (size_bytes, filename, content_type)
+        """
+        resp, filename, content_type = self._open_download(
+            attachment_id, timeout=timeout
+        )
+        size = 0
+        try:
+            with open(path, "wb") as f:
+                for chunk in resp.iter_content(_DOWNLOAD_CHUNK):
+                    f.write(chunk)
+                    size += len(chunk)
+        except requests.exceptions.RequestException as exc:
+            raise SessionExpiredError(f"Download failed: {exc}") from exc
+        finally:
+            resp.close()
+
+        return size, filename, content_type
+
+    # ------------------------------------------------------------------
+    # Convenience: pre-serialized request bodies
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def encode_json(obj) -> bytes:
+        """Serialize a payload fragment exactly as ``request()`` would."""
+        return _json_dumps(obj)
+
+    @staticmethod
+    def json_request_body(request_type: str, header: bytes, body: dict) -> bytes:
+        """Assemble a serialized ``{"__type", "Header", "Body"}`` request.
+
+        ``header`` is already serialized (see ``encode_json``), so constant
+        headers are encoded once instead of on every call. The result can be
+        passed to ``request()`` as the payload.
+        """
+        return b"".join((
+            b'{"__type":', _json_dumps(request_type),
+            b',"Header":', header,
+            b',"Body":', _json_dumps(body), b"}",
+        ))
 
     # ------------------------------------------------------------------
     # Convenience: extract response items
@@ -379,84 +623,66 @@ class OWAClient:
     # Folder helpers
     # ------------------------------------------------------------------
 
+    def clear_folder_cache(self) -> None:
+        """Forget cached folder IDs (after a re-login or folder changes)."""
+        self._distinguished_ids = {}
+        self._distinguished_prefetched = False
+        self._custom_folder_ids = {}
+
+    def _prefetch_distinguished_folders(self) -> None:
+        """Resolve every distinguished folder ID with a single GetFolder call."""
+        data = self.request("GetFolder", _GET_DISTINGUISHED_FOLDERS_BODY)
+        # One response message per requested folder, in request order
+        for dist_id, msg in zip(_DISTINGUISHED_IDS, self.extract_items(data)):
+            for f in msg.get("Folders", []) or []:
+                fid = f.get("FolderId", {}).get("Id")
+                if fid:
+                    self._distinguished_ids[dist_id] = fid
+                    break
+        self._distinguished_prefetched = True
+
     def get_folder_id(self, folder_name: str) -> str | None:
         """Resolve a folder name to its Exchange folder ID.
 
         Supports distinguished folder names (inbox, sentitems, drafts, etc.)
         in both English and Russian, plus custom folder names looked up
         via FindFolder on msgfolderroot.
+
+        Distinguished IDs are fetched together on first use and cached for
+        the session; custom names are cached for ``_FOLDER_CACHE_TTL`` seconds.
         """
         folder_lower = folder_name.lower()
 
         # Check distinguished folders first
         distinguished_id = DISTINGUISHED_FOLDERS.get(folder_lower)
         if distinguished_id:
-            payload = {
-                "__type": "GetFolderJsonRequest:#Exchange",
-                "Header": {
-                    "__type": "JsonRequestHeaders:#Exchange",
-                    "RequestServerVersion": "Exchange2013",
-                },
-                "Body": {
-                    "__type": "GetFolderRequest:#Exchange",
-                    "FolderShape": {
-                        "__type": "FolderResponseShape:#Exchange",
-                        "BaseShape": "IdOnly",
-                    },
-                    "FolderIds": [
-                        {
-                            "__type": "DistinguishedFolderId:#Exchange",
-                            "Id": distinguished_id,
-                        }
-                    ],
-                },
-            }
+            if not self._distinguished_prefetched:
+                self._prefetch_distinguished_folders()
+            fid = self._distinguished_ids.get(distinguished_id)
+            if fid:
+                return fid
 
-            data = self.request("GetFolder", payload)
-            for msg in self.extract_items(data):
-                if "Folders" in msg:
-                    for f in msg["Folders"]:
-                        fid = f.get("FolderId", {}).get("Id")
-                        if fid:
-                            return fid
+        cached = self._custom_folder_ids.get(folder_lower)
+        if cached and time.monotonic() - cached[1] < _FOLDER_CACHE_TTL:
+            return cached[0]
 
         # Fall back to searching custom folders by name
-        payload = {
-            "__type": "FindFolderJsonRequest:#Exchange",
-            "Header": {
-                "__type": "JsonRequestHeaders:#Exchange",
-                "RequestServerVersion": "Exchange2013",
-            },
-            "Body": {
-                "__type": "FindFolderRequest:#Exchange",
-                "FolderShape": {
-                    "__type": "FolderResponseShape:#Exchange",
-                    "BaseShape": "Default",
-                },
-                "ParentFolderIds": [
-                    {
-                        "__type": "DistinguishedFolderId:#Exchange",
-                        "Id": "msgfolderroot",
-                    }
-                ],
-                "Traversal": "Shallow",
-                "Paging": {
-                    "__type": "IndexedPageView:#Exchange",
-                    "BasePoint": "Beginning",
-                    "Offset": 0,
-                    "MaxEntriesReturned": 200,
-                },
-            },
-        }
-
-        data = self.request("FindFolder", payload)
+        data = self.request("FindFolder", _FIND_ROOT_FOLDERS_BODY)
+        # Cache every top-level folder from the listing, not just the match
+        listing: dict[str, str] = {}
         for msg in self.extract_items(data):
             if "RootFolder" in msg and "Folders" in msg["RootFolder"]:
                 for f in msg["RootFolder"]["Folders"]:
-                    if f.get("DisplayName", "").lower() == folder_lower:
-                        return f.get("FolderId", {}).get("Id")
+                    name = f.get("DisplayName", "").lower()
+                    fid = f.get("FolderId", {}).get("Id")
+                    if fid and name not in listing:
+                        listing[name] = fid
+
+        now = time.monotonic()
+        for name, fid in listing.items():
+            self._custom_folder_ids[name] = (fid, now)
 
-        return None
+        return listing.get(folder_lower)
 
     # ------------------------------------------------------------------
     # ResolveNames (directory search / attendee resolution)
@@ -468,26 +694,56 @@ class OWAClient:
         """Call ResolveNames to search the directory.
 
         Returns the list of Resolution dicts from the API, each containing
-        Mailbox and optionally Contact data.
+        Mailbox and optionally Contact data. Non-empty results are cached
+        per normalized query for ``_RESOLVE_CACHE_TTL`` seconds.
         """
-        payload = {
-            "__type": "ResolveNamesJsonRequest:#Exchange",
-            "Header": {
-                "__type": "JsonRequestHeaders:#Exchange",
-                "RequestServerVersion": "Exchange2013",
-            },
-            "Body": {
-                "__type": "ResolveNamesRequest:#Exchange",
-                "UnresolvedEntry": query,
-                "ReturnFullContactData": full_contact,
-                "SearchScope": "ActiveDirectoryContacts",
-                "ContactDataShape": "AllProperties" if full_contact else "Default",
-            },
-        }
+        key = (query.strip().lower(), full_contact)
+        now = time.monotonic()
+        with self._resolve_cache_lock:
+            cached = self._resolve_cache.get(key)
+        if cached and now - cached[0] < _RESOLVE_CACHE_TTL:
+            return list(cached[1])
+
+        body = _RESOLVE_NAMES_TEMPLATES[bool(full_contact)].replace(
+            _QUERY_PLACEHOLDER, _json_dumps(query), 1
+        )
 
-        data = self.request("ResolveNames", payload)
+        data = self.request("ResolveNames", body)
         for msg in self.extract_items(data):
             if "ResolutionSet" in msg and "Resolutions" in msg["ResolutionSet"]:
-                return msg["ResolutionSet"]["Resolutions"]
+                resolutions = msg["ResolutionSet"]["Resolutions"]
+                if resolutions:
+                    with self._resolve_cache_lock:
+                        if len(self._resolve_cache) >= _RESOLVE_CACHE_SIZE:
+                            # Evict the oldest entry (dicts keep insertion order)
+                            self._resolve_cache.pop(next(iter(self._resolve_cache)))
+                        self._resolve_cache[key] = (now, list(resolutions))
+                return resolutions
 
         return []
+
+    def resolve_names_many(
+        self, queries: list[str], *, full_contact: bool = True
+    ) -> dict[str, list[dict]]:
+        """Resolve several directory queries at once.
+
+        ResolveNames takes a single UnresolvedEntry per request, so the
+        distinct queries are looked up concurrently on a small thread pool.
+        Returns a dict mapping each query to its ``resolve_names`` result.
+        """
+        unique = list(dict.fromkeys(queries))
+        if len(unique) <= 1:
+            return {q: self.resolve_names(q, full_contact=full_contact) for q in unique}
+
+        with ThreadPoolExecutor(
+            max_workers=min(_RESOLVE_CONCURRENCY, len(unique))
+        ) as pool:
+            results = pool.map(
+                lambda q: self.resolve_names(q, full_contact=full_contact), unique
+            )
+            return dict(zip(unique, results))
+
+    def clear_resolve_cache(self) -> None:
+        """Forget cached ResolveNames results (e.g. after a re-login)."""
+        with self._resolve_cache_lock:
+            self._resolve_cache.clear()
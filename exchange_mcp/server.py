@@ -2,10 +2,13 @@
 
 Exposes OWA email, calendar, directory, and availability tools via MCP.
 Uses FastMCP with a lifespan context manager to share a single OWAClient
-instance across all tool invocations.
+instance (and its keep-alive connection pool) across all tool invocations.
 """
 
 import asyncio
+import functools
+import inspect
+import sys
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
@@ -35,12 +38,45 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     try:
         yield AppContext(client=client)
     finally:
-        # No persistent connections to clean up (requests is sync + per-call)
-        pass
+        # Shut down the shared login browser if the login tool launched one
+        auth = sys.modules.get("exchange_mcp.auth")
+        try:
+            if auth is not None:
+                await auth.close_browser()
+        finally:
+            client.close()
+            # Drop derived keys along with the session
+            crypto = sys.modules.get("exchange_mcp._crypto")
+            if crypto is not None:
+                crypto.clear_key_cache()
+
+
+def _offload_sync(fn):
+    """Wrap a blocking tool function so it runs in a worker thread.
+
+    FastMCP calls plain ``def`` tools directly on the event loop, so one slow
+    OWA request would stall every other tool call and the login task.
+    functools.wraps keeps the signature and docstring FastMCP inspects.
+    """
+    if inspect.iscoroutinefunction(fn):
+        return fn
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
+
+
+class _ExchangeMCP(FastMCP):
+    """FastMCP that runs synchronous tools off the event loop thread."""
+
+    def add_tool(self, fn, *args, **kwargs) -> None:
+        super().add_tool(_offload_sync(fn), *args, **kwargs)
 
 
 # Create the MCP server instance
-mcp = FastMCP("exchange", lifespan=app_lifespan)
+mcp = _ExchangeMCP("exchange", lifespan=app_lifespan)
 
 # ------------------------------------------------------------------
 # Import tool modules so their @mcp.tool() decorators register tools.
@@ -4,14 +4,16 @@ Provides meeting statistics and connection matrix analysis
 using GetUserAvailability and GetItem APIs.
 """
 
-import json
-from collections import Counter, defaultdict
-from datetime import datetime, timedelta, date
+import asyncio
+import time
+from collections import Counter, defaultdict, deque
+from datetime import datetime, date
 
 from mcp.server.fastmcp import Context
 
 from exchange_mcp.server import mcp, AppContext
 from exchange_mcp.owa_client import OWAClient
+from exchange_mcp.utils import dumps_json
 
 
 def _get_client(ctx: Context) -> OWAClient:
@@ -20,6 +22,50 @@ def _get_client(ctx: Context) -> OWAClient:
     return app_ctx.client
 
 
+# ------------------------------------------------------------------
+# Static payload fragments (shared read-only across requests)
+# ------------------------------------------------------------------
+
+_HEADER = {
+    '__type': 'JsonRequestHeaders:#Exchange',
+    'RequestServerVersion': 'Exchange2013',
+}
+
+_AVAILABILITY_HEADER = {
+    **_HEADER,
+    'TimeZoneContext': {
+        '__type': 'TimeZoneContext:#Exchange',
+        'TimeZoneDefinition': {
+            '__type': 'TimeZoneDefinitionType:#Exchange',
+            'Id': 'Russian Standard Time',
+        },
+    },
+}
+
+# Master-item scan reads only ItemId and Subject
+_MASTER_ITEM_SHAPE = {
+    '__type': 'ItemResponseShape:#Exchange',
+    'BaseShape': 'IdOnly',
+    'AdditionalProperties': [
+        {'__type': 'PropertyUri:#Exchange', 'FieldURI': 'Subject'},
+    ],
+}
+
+_START_DESCENDING = [{
+    '__type': 'SortResults:#Exchange',
+    'Order': 'Descending',
+    'Path': {
+        '__type': 'PropertyUri:#Exchange',
+        'FieldURI': 'Start',
+    },
+}]
+
+_ALL_PROPERTIES_SHAPE = {
+    '__type': 'ItemResponseShape:#Exchange',
+    'BaseShape': 'AllProperties',
+}
+
+
 # ------------------------------------------------------------------
 # Internal: resolve names to emails
 # ------------------------------------------------------------------
@@ -33,101 +79,207 @@ def _resolve_to_email(client: OWAClient, name: str) -> tuple[str, str]:
     return "", ""
 
 
+# ------------------------------------------------------------------
+# Internal: count Mon-Fri days in [start, end)
+# ------------------------------------------------------------------
+
+def _count_workdays(start: date, end: date) -> int:
+    """Count weekdays in the half-open range [start, end) without iterating."""
+    days = (end - start).days
+    if days <= 0:
+        return 0
+    full_weeks, rest = divmod(days, 7)
+    first = start.weekday()
+    # Leftover days are consecutive weekdays starting at `first` (mod 7)
+    extra = sum(1 for i in range(rest) if (first + i) % 7 < 5)
+    return full_weeks * 5 + extra
+
+
 # ------------------------------------------------------------------
 # Internal: query GetUserAvailability in chunks
 # ------------------------------------------------------------------
 
-def _get_availability_events(
+# Max GetUserAvailability requests in flight at once
+_AVAILABILITY_CONCURRENCY = 8
+
+# Per-(viewer, person, window) availability cache: expiry (monotonic) and
+# events. Windows that ended before today are kept longer than current ones.
+_AVAIL_CACHE: dict[tuple[str, str, date, date], tuple[float, list[dict]]] = {}
+_AVAIL_CACHE_SIZE = 4096
+_AVAIL_PAST_TTL = 24 * 3600
+_AVAIL_CURRENT_TTL = 3600
+
+# Master-item scan in get_meeting_contacts: FindItem page size, last page
+# offset scanned, and max pages in flight at once
+_MASTER_PAGE_SIZE = 200
+_MASTER_SCAN_LIMIT = 3000
+_MASTER_PAGE_CONCURRENCY = 4
+
+# Master-item GetItem in get_meeting_contacts: IDs per request and max
+# requests in flight at once
+_GETITEM_BATCH_SIZE = 100
+_GETITEM_CONCURRENCY = 6
+
+
+def _parse_freebusy_events(fb_resp: dict) -> list[dict]:
+    """Extract non-free events from one FreeBusyResponse entry."""
+    cal_events = (fb_resp.get('FreeBusyView') or {}).get('CalendarEventArray')
+    if isinstance(cal_events, dict):
+        items = cal_events.get('Items') or ()
+    elif isinstance(cal_events, list):
+        items = cal_events
+    else:
+        items = ()
+    events = []
+    for event in items:
+        s = event.get('StartTime')
+        bt = event.get('BusyType', '')
+        if s and bt != 'Free':
+            details = event.get('CalendarEventDetails')
+            subject = details.get('Subject', '') if details else ''
+            events.append({
+                'subject': subject,
+                'start_date': s[:10],
+                'busy_type': bt,
+            })
+    return events
+
+
+def _cache_availability(key: tuple, events: list[dict], window_end: date) -> None:
+    """Store one person's events for one window, evicting the oldest if full."""
+    ttl = _AVAIL_PAST_TTL if window_end <= date.today() else _AVAIL_CURRENT_TTL
+    if key not in _AVAIL_CACHE and len(_AVAIL_CACHE) >= _AVAIL_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        _AVAIL_CACHE.pop(next(iter(_AVAIL_CACHE)))
+    _AVAIL_CACHE[key] = (time.monotonic() + ttl, events)
+
+
+def invalidate_availability_cache(viewer: str) -> None:
+    """Forget cached availability fetched by ``viewer``'s mailbox.
+
+    Called by the calendar tools after they create, change, cancel or
+    answer a meeting, since any cached window may now be out of date.
+    """
+    viewer = viewer.lower()
+    # list() snapshots the keys: calendar tools call this from worker threads
+    for key in list(_AVAIL_CACHE):
+        if key[0] == viewer:
+            _AVAIL_CACHE.pop(key, None)
+
+
+async def _get_availability_events(
     client: OWAClient,
     emails: list[str],
     start: date,
     end: date,
     batch_size: int = 5,
     chunk_days: int = 14,
-) -> dict[str, list[dict]]:
+) -> dict[str, tuple[list[dict], set[str]]]:
     """Query GetUserAvailability for multiple people across a date range.
 
-    Returns dict mapping email -> list of calendar event dicts with
-    keys: subject, start_date, busy_type.
-    """
-    results: dict[str, list[dict]] = {email: [] for email in emails}
-
-    # Batch people
-    email_batches = [emails[i:i+batch_size] for i in range(0, len(emails), batch_size)]
+    The range is split into windows aligned to a fixed ``chunk_days`` grid,
+    so overlapping ranges from repeated calls share windows. Each person's
+    events per window are cached in ``_AVAIL_CACHE``; only missing
+    (person, window) pairs are requested, concurrently (at most
+    ``_AVAILABILITY_CONCURRENCY`` in flight).
 
-    for batch in email_batches:
-        current = start
-        while current < end:
-            chunk_end = min(current + timedelta(days=chunk_days), end)
+    Returns dict mapping email -> (events, days): the list of calendar
+    event dicts with keys subject, start_date, busy_type, and the set of
+    distinct start_date values.
+    """
+    # Windows on a grid of chunk_days-long blocks counted from date.min
+    windows: list[tuple[date, date]] = []
+    current = start
+    while current < end:
+        grid_next = date.fromordinal((current.toordinal() // chunk_days + 1) * chunk_days)
+        chunk_end = min(grid_next, end)
+        windows.append((current, chunk_end))
+        current = chunk_end
+
+    viewer = (client.user_email or '').lower()
+    now = time.monotonic()
+    window_events: dict[tuple[str, date], list[dict]] = {}
+
+    # Built once and shared by every payload that references them
+    mailboxes = {
+        email: {
+            '__type': 'MailboxData:#Exchange',
+            'Email': {
+                '__type': 'EmailAddress:#Exchange',
+                'Address': email,
+            },
+            'AttendeeType': 'Required',
+        }
+        for email in emails
+    }
+
+    chunks = []  # (batch, window_start, window_end, payload)
+    for window_start, window_end in windows:
+        view_options = {
+            '__type': 'FreeBusyViewOptions:#Exchange',
+            'TimeWindow': {
+                '__type': 'Duration:#Exchange',
+                'StartTime': f'{window_start}T00:00:00',
+                'EndTime': f'{window_end}T00:00:00',
+            },
+            'MergedFreeBusyIntervalInMinutes': 30,
+            'RequestedView': 'DetailedMerged',
+        }
 
-            mailbox_data = [{
-                '__type': 'MailboxData:#Exchange',
-                'Email': {
-                    '__type': 'EmailAddress:#Exchange',
-                    'Address': email,
-                },
-                'AttendeeType': 'Required',
-            } for email in batch]
+        missing = []
+        for email in emails:
+            cached = _AVAIL_CACHE.get((viewer, email.lower(), window_start, window_end))
+            if cached and now < cached[0]:
+                window_events[(email, window_start)] = cached[1]
+            else:
+                missing.append(email)
 
+        for i in range(0, len(missing), batch_size):
+            batch = missing[i:i+batch_size]
             payload = {
                 '__type': 'GetUserAvailabilityJsonRequest:#Exchange',
-                'Header': {
-                    '__type': 'JsonRequestHeaders:#Exchange',
-                    'RequestServerVersion': 'Exchange2013',
-                    'TimeZoneContext': {
-                        '__type': 'TimeZoneContext:#Exchange',
-                        'TimeZoneDefinition': {
-                            '__type': 'TimeZoneDefinitionType:#Exchange',
-                            'Id': 'Russian Standard Time',
-                        },
-                    },
-                },
+                'Header': _AVAILABILITY_HEADER,
                 'Body': {
                     '__type': 'GetUserAvailabilityRequest:#Exchange',
-                    'MailboxDataArray': mailbox_data,
-                    'FreeBusyViewOptions': {
-                        '__type': 'FreeBusyViewOptions:#Exchange',
-                        'TimeWindow': {
-                            '__type': 'Duration:#Exchange',
-                            'StartTime': f'{current}T00:00:00',
-                            'EndTime': f'{chunk_end}T00:00:00',
-                        },
-                        'MergedFreeBusyIntervalInMinutes': 30,
-                        'RequestedView': 'DetailedMerged',
-                    },
+                    'MailboxDataArray': [mailboxes[email] for email in batch],
+                    'FreeBusyViewOptions': view_options,
                 },
             }
+            chunks.append((batch, window_start, window_end, payload))
 
-            try:
-                data = client.request('GetUserAvailability', payload)
-                body = data.get('Body', {})
-                for i, fb_resp in enumerate(body.get('FreeBusyResponseArray', [])):
-                    if i >= len(batch):
-                        break
-                    email = batch[i]
-                    fb_view = fb_resp.get('FreeBusyView', {})
-                    cal_events = fb_view.get('CalendarEventArray', {})
-                    if isinstance(cal_events, dict):
-                        items = cal_events.get('Items', [])
-                    elif isinstance(cal_events, list):
-                        items = cal_events
-                    else:
-                        items = []
-                    for event in items:
-                        s = event.get('StartTime', '')
-                        bt = event.get('BusyType', '')
-                        if s and bt != 'Free':
-                            details = event.get('CalendarEventDetails', {})
-                            subject = details.get('Subject', '') if details else ''
-                            results[email].append({
-                                'subject': subject,
-                                'start_date': s[:10],
-                                'busy_type': bt,
-                            })
-            except Exception:
-                pass
-
-            current = chunk_end
+    sem = asyncio.Semaphore(_AVAILABILITY_CONCURRENCY)
+
+    async def _fetch(payload: dict):
+        async with sem:
+            return await client.arequest('GetUserAvailability', payload)
+
+    responses = await asyncio.gather(
+        *(_fetch(chunk[3]) for chunk in chunks), return_exceptions=True
+    )
+
+    for (batch, window_start, window_end, _), data in zip(chunks, responses):
+        if isinstance(data, Exception):
+            continue
+        try:
+            fb_responses = (data.get('Body') or {}).get('FreeBusyResponseArray') or ()
+            for email, fb_resp in zip(batch, fb_responses):
+                events = _parse_freebusy_events(fb_resp)
+                window_events[(email, window_start)] = events
+                _cache_availability(
+                    (viewer, email.lower(), window_start, window_end), events, window_end
+                )
+        except Exception:
+            pass
+
+    # Assemble in window order so each person's events stay chronological
+    results: dict[str, tuple[list[dict], set[str]]] = {
+        email: ([], set()) for email in emails
+    }
+    for email, (events, days) in results.items():
+        for window_start, _ in windows:
+            for event in window_events.get((email, window_start), ()):
+                events.append(event)
+                days.add(event['start_date'])
 
     return results
 
@@ -137,7 +289,7 @@ def _get_availability_events(
 # ------------------------------------------------------------------
 
 @mcp.tool()
-def get_meeting_stats(
+async def get_meeting_stats(
     people: str,
     start_date: str,
     end_date: str,
@@ -163,16 +315,19 @@ def get_meeting_stats(
         sd = datetime.strptime(start_date, '%Y-%m-%d').date()
         ed = datetime.strptime(end_date, '%Y-%m-%d').date()
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date format: {e}"})
+        return dumps_json({"error": f"Invalid date format: {e}"})
 
     # Resolve names
     name_list = [n.strip() for n in people.split(',') if n.strip()]
     if not name_list:
-        return json.dumps({"error": "No people specified."})
+        return dumps_json({"error": "No people specified."})
 
+    # Resolve all names concurrently (cached ones return without a request)
+    lookups = await asyncio.gather(
+        *(asyncio.to_thread(_resolve_to_email, client, name) for name in name_list)
+    )
     resolved = []  # (display_name, email)
-    for name in name_list:
-        display, email = _resolve_to_email(client, name)
+    for name, (display, email) in zip(name_list, lookups):
         if email:
             resolved.append((display, email))
         else:
@@ -180,19 +335,12 @@ def get_meeting_stats(
 
     emails = [email for _, email in resolved if email]
     if not emails:
-        return json.dumps({"error": "Could not resolve any names to email addresses."})
+        return dumps_json({"error": "Could not resolve any names to email addresses."})
 
     # Query availability
-    avail = _get_availability_events(client, emails, sd, ed)
+    avail = await _get_availability_events(client, emails, sd, ed)
 
-    # Count working days
-    workdays = 0
-    d = sd
-    while d < ed:
-        if d.weekday() < 5:
-            workdays += 1
-        d += timedelta(days=1)
-    workdays = max(workdays, 1)
+    workdays = max(_count_workdays(sd, ed), 1)
 
     # Build stats
     stats = []
@@ -208,9 +356,9 @@ def get_meeting_stats(
             })
             continue
 
-        events = avail[email]
+        events, days = avail[email]
         total = len(events)
-        unique_days = len(set(ev['start_date'] for ev in events))
+        unique_days = len(days)
         avg = round(total / workdays, 1)
 
         stats.append({
@@ -225,10 +373,10 @@ def get_meeting_stats(
     # Sort by total descending
     stats.sort(key=lambda x: x["total_meetings"], reverse=True)
 
-    return json.dumps({
+    return dumps_json({
         "period": {"start": start_date, "end": end_date, "workdays": workdays},
         "stats": stats,
-    }, ensure_ascii=False)
+    })
 
 
 # ------------------------------------------------------------------
@@ -236,7 +384,7 @@ def get_meeting_stats(
 # ------------------------------------------------------------------
 
 @mcp.tool()
-def get_meeting_contacts(
+async def get_meeting_contacts(
     start_date: str,
     end_date: str,
     top_n: int = 30,
@@ -263,110 +411,165 @@ def get_meeting_contacts(
         sd = datetime.strptime(start_date, '%Y-%m-%d').date()
         ed = datetime.strptime(end_date, '%Y-%m-%d').date()
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date format: {e}"})
+        return dumps_json({"error": f"Invalid date format: {e}"})
 
     # Step 1: Get own expanded events via GetUserAvailability
     # to count subject occurrences (handles recurring meetings)
     own_email = client.user_email.lower() if client.user_email else ""
     if not own_email:
-        return json.dumps({"error": "User email not available. Call the login tool first."})
-
-    folder_id = client.get_folder_id("calendar")
-    if not folder_id:
-        return json.dumps({"error": "Could not find calendar folder."})
+        return dumps_json({"error": "User email not available. Call the login tool first."})
 
     # Get expanded event subjects with occurrence counts
-    avail_result = _get_availability_events(client, [client.user_email], sd, ed)
-    expanded_events = avail_result.get(client.user_email, [])
+    avail_result = await _get_availability_events(client, [client.user_email], sd, ed)
+    expanded_events, _ = avail_result.get(client.user_email, ([], set()))
 
     subject_counts = Counter(ev['subject'] for ev in expanded_events)
     total_expanded = len(expanded_events)
 
+    # Subjects still looking for a master item ('' can never match)
+    remaining = {subj for subj in subject_counts if subj}
+    if not remaining:
+        # Nothing to match: skip the calendar scan and GetItem entirely
+        return dumps_json({
+            "period": {"start": start_date, "end": end_date},
+            "total_meetings": total_expanded,
+            "unique_contacts": 0,
+            "contacts": [],
+        })
+
+    folder_id = await asyncio.to_thread(client.get_folder_id, "calendar")
+    if not folder_id:
+        return dumps_json({"error": "Could not find calendar folder."})
+
     # Step 2: Find master calendar items for each unique subject
-    # Scan entire calendar (descending) to match subjects
+    # Scan entire calendar (descending) to match subjects. Pages are
+    # fetched concurrently but consumed in offset order, so the first
+    # (most recent) match per subject still wins.
     subject_to_id: dict[str, str] = {}
-    offset = 0
 
-    while len(subject_to_id) < len(subject_counts):
-        payload = {
-            '__type': 'FindItemJsonRequest:#Exchange',
-            'Header': {
-                '__type': 'JsonRequestHeaders:#Exchange',
-                'RequestServerVersion': 'Exchange2013',
+    # Everything but the page offset is fixed for this scan
+    find_body = {
+        '__type': 'FindItemRequest:#Exchange',
+        'ItemShape': _MASTER_ITEM_SHAPE,
+        'ParentFolderIds': [
+            {'__type': 'FolderId:#Exchange', 'Id': folder_id}
+        ],
+        'Traversal': 'Shallow',
+        # Skip items starting at/after the range end: neither single
+        # meetings nor series that begin there can recur inside it.
+        # (No lower bound: a series master's Start is its first
+        # occurrence, which may be long before start_date.)
+        'Restriction': {
+            '__type': 'RestrictionType:#Exchange',
+            'Item': {
+                '__type': 'IsLessThan:#Exchange',
+                'FieldURIOrConstant': {
+                    '__type': 'FieldURIOrConstantType:#Exchange',
+                    'Item': {
+                        '__type': 'ConstantValueType:#Exchange',
+                        'Value': f'{ed}T00:00:00',
+                    },
+                },
+                'Path': {
+                    '__type': 'PropertyUri:#Exchange',
+                    'FieldURI': 'Start',
+                },
             },
+        },
+        'SortOrder': _START_DESCENDING,
+    }
+
+    def _find_page_payload(offset: int) -> dict:
+        return {
+            '__type': 'FindItemJsonRequest:#Exchange',
+            'Header': _HEADER,
             'Body': {
-                '__type': 'FindItemRequest:#Exchange',
-                'ItemShape': {
-                    '__type': 'ItemResponseShape:#Exchange',
-                    'BaseShape': 'Default',
-                },
-                'ParentFolderIds': [
-                    {'__type': 'FolderId:#Exchange', 'Id': folder_id}
-                ],
-                'Traversal': 'Shallow',
+                **find_body,
                 'Paging': {
                     '__type': 'IndexedPageView:#Exchange',
                     'BasePoint': 'Beginning',
                     'Offset': offset,
-                    'MaxEntriesReturned': 200,
+                    'MaxEntriesReturned': _MASTER_PAGE_SIZE,
                 },
-                'SortOrder': [{
-                    '__type': 'SortResults:#Exchange',
-                    'Order': 'Descending',
-                    'Path': {
-                        '__type': 'PropertyUri:#Exchange',
-                        'FieldURI': 'Start',
-                    },
-                }],
             },
         }
 
-        data = client.request('FindItem', payload)
-        items = client.extract_items(data)
-        if not items:
-            break
-        folder_items = items[0].get('RootFolder', {}).get('Items', [])
-        is_last = items[0].get('RootFolder', {}).get('IncludesLastItemInRange', True)
-        if not folder_items:
-            break
-
-        for item in folder_items:
-            subj = item.get('Subject', '')
-            if subj and subj in subject_counts and subj not in subject_to_id:
-                subject_to_id[subj] = item.get('ItemId', {}).get('Id', '')
-
-        if is_last:
-            break
-        offset += 200
-        if offset > 3000:
-            break
-
-    # Step 3: GetItem for each master to get attendees
+    # Sliding window: keep at most _MASTER_PAGE_CONCURRENCY pages in flight
+    # and request the next offset only once one has been consumed, so an
+    # early stop wastes at most a window's worth of requests
+    offsets = iter(range(0, _MASTER_SCAN_LIMIT + 1, _MASTER_PAGE_SIZE))
+    pages: deque[asyncio.Task] = deque()
+
+    def _schedule_next() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            pages.append(asyncio.create_task(
+                client.arequest('FindItem', _find_page_payload(offset))
+            ))
+
+    for _ in range(_MASTER_PAGE_CONCURRENCY):
+        _schedule_next()
+    try:
+        while pages:
+            data = await pages.popleft()
+            _schedule_next()
+            items = client.extract_items(data)
+            if not items:
+                break
+            folder_items = items[0].get('RootFolder', {}).get('Items', [])
+            is_last = items[0].get('RootFolder', {}).get('IncludesLastItemInRange', True)
+            if not folder_items:
+                break
+
+            for item in folder_items:
+                subj = item.get('Subject', '')
+                if subj in remaining:
+                    subject_to_id[subj] = item.get('ItemId', {}).get('Id', '')
+                    remaining.discard(subj)
+
+            if is_last or not remaining:
+                break
+    finally:
+        # Drop pages past the one that ended the scan
+        for page in pages:
+            page.cancel()
+        await asyncio.gather(*pages, return_exceptions=True)
+
+    # Step 3: GetItem for each master to get attendees (batches in parallel)
     unique_ids = list(set(subject_to_id.values()))
-    id_to_attendees: dict[str, set] = {}
+    id_to_attendees: dict[str, set[str]] = {}  # item id -> attendee emails
+    email_to_name: dict[str, str] = {}
+
+    sem = asyncio.Semaphore(_GETITEM_CONCURRENCY)
 
-    for bi in range(0, len(unique_ids), 10):
-        batch = unique_ids[bi:bi+10]
+    async def _fetch_items(batch: list[str]) -> dict:
         item_id_list = [{"__type": "ItemId:#Exchange", "Id": iid} for iid in batch]
 
         payload = {
             "__type": "GetItemJsonRequest:#Exchange",
-            "Header": {
-                "__type": "JsonRequestHeaders:#Exchange",
-                "RequestServerVersion": "Exchange2013",
-            },
+            "Header": _HEADER,
             "Body": {
                 "__type": "GetItemRequest:#Exchange",
-                "ItemShape": {
-                    "__type": "ItemResponseShape:#Exchange",
-                    "BaseShape": "AllProperties",
-                },
+                "ItemShape": _ALL_PROPERTIES_SHAPE,
                 "ItemIds": item_id_list,
             },
         }
 
+        async with sem:
+            return await client.arequest("GetItem", payload)
+
+    responses = await asyncio.gather(
+        *(
+            _fetch_items(unique_ids[bi:bi+_GETITEM_BATCH_SIZE])
+            for bi in range(0, len(unique_ids), _GETITEM_BATCH_SIZE)
+        ),
+        return_exceptions=True,
+    )
+
+    for data in responses:
+        if isinstance(data, Exception):
+            continue
         try:
-            data = client.request("GetItem", payload)
             for msg in client.extract_items(data):
                 if "Items" not in msg:
                     continue
@@ -382,40 +585,45 @@ def get_meeting_contacts(
                             addr = mailbox.get("EmailAddress", "")
                             if not name or not addr or addr.startswith("/O="):
                                 continue
-                            attendees.add((name, addr.lower()))
+                            email = addr.lower()
+                            if not email_to_name.get(email):
+                                email_to_name[email] = name
+                            attendees.add(email)
 
                     organizer = item.get("Organizer", {}).get("Mailbox", {})
                     if organizer:
                         org_addr = organizer.get("EmailAddress", "")
                         org_name = organizer.get("Name", "")
                         if org_addr and not org_addr.startswith("/O="):
-                            attendees.add((org_name, org_addr.lower()))
+                            email = org_addr.lower()
+                            if not email_to_name.get(email):
+                                email_to_name[email] = org_name
+                            attendees.add(email)
 
+                    # Exclude self here so aggregation needs no check
+                    attendees.discard(own_email)
                     id_to_attendees[item_id] = attendees
         except Exception:
             pass
 
-    # Step 4: Build weighted contacts, excluding self
-    contacts = Counter()
+    # Step 4: Build weighted contacts keyed by email (self already excluded)
+    contacts: Counter[str] = Counter()
     for subject, item_id in subject_to_id.items():
         weight = subject_counts.get(subject, 1)
-        attendees = id_to_attendees.get(item_id, set())
-        for name, email in attendees:
-            if own_email and email == own_email:
-                continue
-            contacts[(name, email)] += weight
+        for email in id_to_attendees.get(item_id, ()):
+            contacts[email] += weight
 
     result_contacts = []
-    for (name, email), count in contacts.most_common(top_n):
+    for email, count in contacts.most_common(top_n):
         result_contacts.append({
-            "name": name,
+            "name": email_to_name.get(email, ""),
             "email": email,
             "meetings": count,
         })
 
-    return json.dumps({
+    return dumps_json({
         "period": {"start": start_date, "end": end_date},
         "total_meetings": total_expanded,
         "unique_contacts": len(contacts),
         "contacts": result_contacts,
-    }, ensure_ascii=False)
+    })
@@ -7,10 +7,12 @@ encrypted at rest with the master password.
 The login flow is non-blocking for 2FA:
 1. First call starts browser login in the background and returns immediately
    with instructions to approve 2FA on the mobile app.
-2. Second call checks the background task result and loads cookies on success.
+2. Second call waits briefly for the background task, then loads cookies on
+   success (or reports that 2FA is still pending).
 """
 
 import asyncio
+import importlib.util
 import json
 
 from mcp.server.fastmcp import Context
@@ -18,6 +20,32 @@ from mcp.server.fastmcp import Context
 from exchange_mcp.server import mcp, AppContext
 from exchange_mcp.owa_client import OWAClient
 
+# How long a follow-up login call waits on a pending 2FA login before
+# reporting that it is still waiting (seconds)
+_PENDING_LOGIN_WAIT = 25
+
+# Constant GetFolder(inbox) request used to probe whether the session works
+_INBOX_PROBE = {
+    "__type": "GetFolderJsonRequest:#Exchange",
+    "Header": {
+        "__type": "JsonRequestHeaders:#Exchange",
+        "RequestServerVersion": "Exchange2013",
+    },
+    "Body": {
+        "__type": "GetFolderRequest:#Exchange",
+        "FolderShape": {
+            "__type": "FolderResponseShape:#Exchange",
+            "BaseShape": "IdOnly",
+        },
+        "FolderIds": [
+            {
+                "__type": "DistinguishedFolderId:#Exchange",
+                "Id": "inbox",
+            }
+        ],
+    },
+}
+
 
 def _get_app_ctx(ctx: Context) -> AppContext:
     """Extract the AppContext from the MCP lifespan context."""
@@ -29,31 +57,11 @@ def _get_client(ctx: Context) -> OWAClient:
     return _get_app_ctx(ctx).client
 
 
-def _session_is_valid(client: OWAClient) -> bool:
+async def _session_is_valid(client: OWAClient) -> bool:
     """Quick check: can we reach the inbox?"""
     try:
         client._ensure_loaded()
-        payload = {
-            "__type": "GetFolderJsonRequest:#Exchange",
-            "Header": {
-                "__type": "JsonRequestHeaders:#Exchange",
-                "RequestServerVersion": "Exchange2013",
-            },
-            "Body": {
-                "__type": "GetFolderRequest:#Exchange",
-                "FolderShape": {
-                    "__type": "FolderResponseShape:#Exchange",
-                    "BaseShape": "IdOnly",
-                },
-                "FolderIds": [
-                    {
-                        "__type": "DistinguishedFolderId:#Exchange",
-                        "Id": "inbox",
-                    }
-                ],
-            },
-        }
-        data = client.request("GetFolder", payload)
+        data = await client.arequest("GetFolder", _INBOX_PROBE)
         items = client.extract_items(data)
         return bool(items)
     except Exception:
@@ -76,7 +84,8 @@ async def login(
     **Two-call 2FA flow**: The first call starts the browser login in the
     background and returns immediately asking you to tell the user to approve
     2FA on their phone.  Call login again with the same master_password after
-    the user approves — the second call picks up the result.
+    the user approves — the second call waits up to 25 seconds for the
+    approval and picks up the result.
 
     Args:
         master_password: Decrypts stored credentials (and cookies), or encrypts
@@ -97,6 +106,13 @@ async def login(
     if app_ctx.pending_login is not None:
         task = app_ctx.pending_login
 
+        if not task.done():
+            # Long-poll: give the user a window to approve before answering
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=_PENDING_LOGIN_WAIT)
+            except Exception:
+                pass  # timed out, or failed (reported when harvested below)
+
         if not task.done():
             return json.dumps({
                 "status": "awaiting_2fa",
@@ -117,7 +133,7 @@ async def login(
             try:
                 encrypt_cookie_file(cookies_str, master_password, client.cookie_file)
                 client.load_cookies_from_string(cookies_str)
-                if _session_is_valid(client):
+                if await _session_is_valid(client):
                     return json.dumps({"success": True, "message": "Logged in and session verified. Cookies encrypted."})
                 else:
                     return json.dumps({"success": True, "message": "Cookies saved but session verification failed. Try again."})
@@ -131,13 +147,11 @@ async def login(
     # ------------------------------------------------------------------
 
     # 1. Check if already authenticated (cookies already in memory)
-    if _session_is_valid(client):
+    if await _session_is_valid(client):
         return json.dumps({"success": True, "message": "Session is already active."})
 
     # 2. Verify playwright is available
-    try:
-        import playwright  # noqa: F401
-    except ImportError:
+    if importlib.util.find_spec("playwright") is None:
         return json.dumps({
             "success": False,
             "error": "playwright is not installed. Run: pip install playwright && playwright install chromium",
@@ -178,7 +192,7 @@ async def login(
     if cookies_str:
         try:
             client.load_cookies_from_string(cookies_str)
-            if _session_is_valid(client):
+            if await _session_is_valid(client):
                 return json.dumps({
                     "success": True,
                     "message": "Session restored from encrypted cookies.",
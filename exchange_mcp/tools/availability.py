@@ -4,13 +4,17 @@ Ports find-free-time.py and find-meeting-time.py logic into MCP tools
 using OWAClient.
 """
 
-import json
-from datetime import datetime, timedelta
+import re
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+from operator import itemgetter
 
 from mcp.server.fastmcp import Context
 
 from exchange_mcp.server import mcp, AppContext
 from exchange_mcp.owa_client import OWAClient
+from exchange_mcp.utils import dumps_json
 
 
 def _get_client(ctx: Context) -> OWAClient:
@@ -19,10 +23,51 @@ def _get_client(ctx: Context) -> OWAClient:
     return app_ctx.client
 
 
+# ------------------------------------------------------------------
+# Static payload fragments (shared read-only across requests)
+# ------------------------------------------------------------------
+
+_HEADER = {
+    '__type': 'JsonRequestHeaders:#Exchange',
+    'RequestServerVersion': 'Exchange2013',
+}
+
+_AVAILABILITY_HEADER = {
+    **_HEADER,
+    'TimeZoneContext': {
+        '__type': 'TimeZoneContext:#Exchange',
+        'TimeZoneDefinition': {
+            '__type': 'TimeZoneDefinitionType:#Exchange',
+            'Id': 'Russian Standard Time',
+        },
+    },
+}
+
+_ALL_PROPERTIES_SHAPE = {
+    '__type': 'ItemResponseShape:#Exchange',
+    'BaseShape': 'AllProperties',
+}
+
+_START_ASCENDING = [{
+    '__type': 'SortResults:#Exchange',
+    'Order': 'Ascending',
+    'Path': {
+        '__type': 'PropertyUri:#Exchange',
+        'FieldURI': 'Start',
+    },
+}]
+
+
 # ------------------------------------------------------------------
 # Pure helper functions (preserved from find-meeting-time.py)
 # ------------------------------------------------------------------
 
+_MINUTE = timedelta(minutes=1)
+
+# A run of identical non-free slots in a MergedFreeBusy string
+_BUSY_RUN_RE = re.compile(r'1+|2+|3+|4+')
+
+
 def _parse_freebusy_string(
     freebusy_str: str, start_time: datetime, interval_minutes: int = 30
 ) -> list[tuple]:
@@ -30,81 +75,133 @@ def _parse_freebusy_string(
 
     Each character represents a time slot:
     0 = Free, 1 = Tentative, 2 = Busy, 3 = Out of Office, 4 = Working Elsewhere
+
+    Consecutive slots with the same status are returned as one
+    (start, end, status) period; datetimes are only built per run.
     """
-    busy_periods = []
-    current_time = start_time
+    step = timedelta(minutes=interval_minutes)
+    return [
+        (start_time + step * m.start(), start_time + step * m.end(), m.group()[0])
+        for m in _BUSY_RUN_RE.finditer(freebusy_str)
+    ]
+
 
-    for char in freebusy_str:
-        next_time = current_time + timedelta(minutes=interval_minutes)
-        if char in ['1', '2', '3', '4']:  # Not free
-            busy_periods.append((current_time, next_time, char))
-        current_time = next_time
+# MergedFreeBusy status -> busy bit: 1-4 are busy; 0, 5 (No Data) and any
+# unexpected character count as free
+_NOT_BUSY_RE = re.compile('[^1-4]')
+_BUSY_BITS = str.maketrans('234', '111')
 
-    return busy_periods
+
+def _union_freebusy(freebusy_strs: list[str]) -> str:
+    """OR several MergedFreeBusy strings sharing one time grid slot by slot.
+
+    Returns a string with '1' wherever any attendee is not free and '0'
+    elsewhere; each string is folded in as a single integer bitmask.
+    """
+    width = max(map(len, freebusy_strs))
+    union = 0
+    for fb in freebusy_strs:
+        bits = _NOT_BUSY_RE.sub('0', fb).translate(_BUSY_BITS)
+        union |= int(bits.ljust(width, '0'), 2)
+    return format(union, f'0{width}b')
 
 
 def _merge_busy_periods(all_busy: list) -> list[tuple]:
-    """Merge overlapping busy periods."""
+    """Merge overlapping busy periods.
+
+    ``all_busy`` is sorted in place; callers pass a list they own.
+    """
     if not all_busy:
         return []
 
-    # Sort by start time
-    sorted_busy = sorted(all_busy, key=lambda x: x[0])
-    merged = [(sorted_busy[0][0], sorted_busy[0][1])]
+    # Sort by start time, then sweep keeping the open interval in locals
+    all_busy.sort(key=itemgetter(0))
+    periods = iter(all_busy)
+    cur_start, cur_end, *_ = next(periods)
+    merged = []
 
-    for start, end, *_ in sorted_busy[1:]:
-        if start <= merged[-1][1]:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+    for start, end, *_ in periods:
+        if start <= cur_end:
+            if end > cur_end:
+                cur_end = end
         else:
-            merged.append((start, end))
+            merged.append((cur_start, cur_end))
+            cur_start, cur_end = start, end
 
+    merged.append((cur_start, cur_end))
     return merged
 
 
 def _find_free_slots(
-    busy_periods: list, date, start_hour: int, end_hour: int, duration_minutes: int
+    busy_periods: list, date, start_time: time, end_time: time, duration_minutes: int
 ) -> list[tuple]:
-    """Find free slots on a given date within working hours."""
-    day_start = datetime.combine(date, datetime.min.time().replace(hour=start_hour))
-    day_end = datetime.combine(date, datetime.min.time().replace(hour=end_hour))
-
-    # Filter busy periods to this day
-    day_busy = []
-    for period in busy_periods:
-        start, end = period[0], period[1]
-        if end.date() < date or start.date() > date:
-            continue
-        start = max(start, day_start)
-        end = min(end, day_end)
-        if start < end:
-            day_busy.append((start, end))
+    """Find free slots on a given date within working hours.
 
-    # Merge overlapping
-    merged = _merge_busy_periods([(s, e) for s, e in day_busy])
+    ``busy_periods`` must already be merged (sorted, non-overlapping) by
+    ``_merge_busy_periods``, so callers merge once for the whole range and
+    each day bisects straight to the periods overlapping its hours.
+    """
+    day_start = datetime.combine(date, start_time)
+    day_end = datetime.combine(date, end_time)
+    min_gap = duration_minutes * _MINUTE
+
+    # Periods overlapping working hours: from the first one ending after
+    # the day starts up to (not including) the first one starting at its end
+    lo = bisect_right(busy_periods, day_start, key=itemgetter(1))
+    hi = bisect_left(busy_periods, day_end, lo=lo, key=itemgetter(0))
+    if lo == hi:
+        if day_end - day_start >= min_gap:
+            return [(day_start, day_end)]
+        return []
 
     # Find gaps
     free_slots = []
     current = day_start
 
-    for busy_start, busy_end in merged:
+    for busy_start, busy_end in busy_periods[lo:hi]:
+        busy_start = max(busy_start, day_start)
+        busy_end = min(busy_end, day_end)
+        if busy_start >= busy_end:
+            continue
         if current < busy_start:
-            gap_duration = (busy_start - current).total_seconds() / 60
-            if gap_duration >= duration_minutes:
+            if busy_start - current >= min_gap:
                 free_slots.append((current, busy_start))
         current = max(current, busy_end)
 
     # Check for time after last meeting
     if current < day_end:
-        gap_duration = (day_end - current).total_seconds() / 60
-        if gap_duration >= duration_minutes:
+        if day_end - current >= min_gap:
             free_slots.append((current, day_end))
 
     return free_slots
 
 
+def _parse_iso(dt_str: str) -> datetime:
+    """Parse an OWA ISO timestamp to a naive datetime (offset dropped).
+
+    The wall-clock time is kept as-is, matching the previous
+    ``fromisoformat(...).replace(tzinfo=None)`` without the extra
+    string and datetime copies.
+    """
+    if dt_str.endswith('Z'):
+        return datetime.fromisoformat(dt_str[:-1])
+    dt = datetime.fromisoformat(dt_str)
+    return dt.replace(tzinfo=None) if dt.tzinfo is not None else dt
+
+
+def _weekdays(start, end) -> list:
+    """Return the Monday-Friday dates from start to end inclusive."""
+    # Proleptic ordinal 1 is a Monday, so weekends are ordinals 0 and 6 mod 7
+    return [
+        type(start).fromordinal(o)
+        for o in range(start.toordinal(), end.toordinal() + 1)
+        if 0 < o % 7 < 6
+    ]
+
+
 def _format_time(dt: datetime) -> str:
     """Format datetime as HH:MM."""
-    return dt.strftime('%H:%M')
+    return f'{dt.hour:02d}:{dt.minute:02d}'
 
 
 # ------------------------------------------------------------------
@@ -117,17 +214,7 @@ def _get_availability_events(
     """Get busy events via GetUserAvailability (expands recurring events)."""
     payload = {
         '__type': 'GetUserAvailabilityJsonRequest:#Exchange',
-        'Header': {
-            '__type': 'JsonRequestHeaders:#Exchange',
-            'RequestServerVersion': 'Exchange2013',
-            'TimeZoneContext': {
-                '__type': 'TimeZoneContext:#Exchange',
-                'TimeZoneDefinition': {
-                    '__type': 'TimeZoneDefinitionType:#Exchange',
-                    'Id': 'Russian Standard Time',
-                },
-            },
-        },
+        'Header': _AVAILABILITY_HEADER,
         'Body': {
             '__type': 'GetUserAvailabilityRequest:#Exchange',
             'MailboxDataArray': [{
@@ -170,8 +257,8 @@ def _get_availability_events(
             if not start_str or not end_str:
                 continue
             try:
-                start = datetime.fromisoformat(start_str.replace('Z', '+00:00')).replace(tzinfo=None)
-                end = datetime.fromisoformat(end_str.replace('Z', '+00:00')).replace(tzinfo=None)
+                start = _parse_iso(start_str)
+                end = _parse_iso(end_str)
                 events.append({'start': start, 'end': end, 'status': bt})
             except (ValueError, AttributeError):
                 continue
@@ -184,33 +271,8 @@ def _get_availability_events(
 # ------------------------------------------------------------------
 
 def _get_calendar_folder_id(client: OWAClient) -> str | None:
-    """Get the calendar folder ID via GetFolder."""
-    payload = {
-        '__type': 'GetFolderJsonRequest:#Exchange',
-        'Header': {
-            '__type': 'JsonRequestHeaders:#Exchange',
-            'RequestServerVersion': 'Exchange2013',
-        },
-        'Body': {
-            '__type': 'GetFolderRequest:#Exchange',
-            'FolderShape': {
-                '__type': 'FolderResponseShape:#Exchange',
-                'BaseShape': 'IdOnly',
-            },
-            'FolderIds': [
-                {'__type': 'DistinguishedFolderId:#Exchange', 'Id': 'calendar'}
-            ],
-        },
-    }
-
-    data = client.request("GetFolder", payload)
-    for msg in client.extract_items(data):
-        if "Folders" in msg:
-            for f in msg["Folders"]:
-                fid = f.get("FolderId", {}).get("Id")
-                if fid:
-                    return fid
-    return None
+    """Get the calendar folder ID (cached by the client for the session)."""
+    return client.get_folder_id("calendar")
 
 
 # ------------------------------------------------------------------
@@ -222,25 +284,17 @@ def _get_calendar_events(
 ) -> list[dict]:
     """Get calendar events within a date range. Returns list of busy period dicts."""
     events = []
-    offset = 0
     batch_size = 100
+    parent_ids = [{'__type': 'FolderId:#Exchange', 'Id': folder_id}]
 
-    while True:
+    def fetch_page(offset: int) -> dict:
         payload = {
             '__type': 'FindItemJsonRequest:#Exchange',
-            'Header': {
-                '__type': 'JsonRequestHeaders:#Exchange',
-                'RequestServerVersion': 'Exchange2013',
-            },
+            'Header': _HEADER,
             'Body': {
                 '__type': 'FindItemRequest:#Exchange',
-                'ItemShape': {
-                    '__type': 'ItemResponseShape:#Exchange',
-                    'BaseShape': 'AllProperties',
-                },
-                'ParentFolderIds': [
-                    {'__type': 'FolderId:#Exchange', 'Id': folder_id}
-                ],
+                'ItemShape': _ALL_PROPERTIES_SHAPE,
+                'ParentFolderIds': parent_ids,
                 'Traversal': 'Shallow',
                 'Paging': {
                     '__type': 'IndexedPageView:#Exchange',
@@ -248,72 +302,65 @@ def _get_calendar_events(
                     'Offset': offset,
                     'MaxEntriesReturned': batch_size,
                 },
-                'SortOrder': [
-                    {
-                        '__type': 'SortResults:#Exchange',
-                        'Order': 'Ascending',
-                        'Path': {
-                            '__type': 'PropertyUri:#Exchange',
-                            'FieldURI': 'Start',
-                        },
-                    }
-                ],
+                'SortOrder': _START_ASCENDING,
             },
         }
+        return client.request("FindItem", payload)
+
+    # Pipeline the paging: the next page is requested in the background
+    # while the current one is being parsed
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        offset = 0
+        pending = pool.submit(fetch_page, offset)
+        while pending is not None:
+            data = pending.result()
+            pending = None
+            # One FindItem response message per request
+            first_msg = next(iter(client.extract_items(data)), None)
+            if not first_msg:
+                break
+
+            root = first_msg.get('RootFolder', {})
+            folder_items = root.get('Items', [])
+            if not folder_items:
+                break
+
+            if not root.get('IncludesLastItemInRange', True):
+                offset += batch_size
+                pending = pool.submit(fetch_page, offset)
+
+            for item in folder_items:
+                # Skip cancelled events
+                if item.get('IsCancelled'):
+                    continue
 
-        data = client.request("FindItem", payload)
-        items = client.extract_items(data)
-
-        if not items:
-            break
-
-        folder_items = items[0].get('RootFolder', {}).get('Items', [])
-        if not folder_items:
-            break
-
-        for item in folder_items:
-            # Skip cancelled events
-            if item.get('IsCancelled'):
-                continue
-
-            # Skip free/tentative slots
-            fbt = item.get('FreeBusyType', 'Busy')
-            if fbt in ['Free', 'NoData']:
-                continue
-
-            start_str = item.get('Start', '')
-            end_str = item.get('End', '')
-
-            if not start_str or not end_str:
-                continue
-
-            try:
-                start = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-                end = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
-
-                # Convert to naive datetime for comparison
-                start = start.replace(tzinfo=None)
-                end = end.replace(tzinfo=None)
-
-                # Filter by date range
-                if end.date() < start_date or start.date() > end_date:
+                # Skip free/tentative slots
+                fbt = item.get('FreeBusyType', 'Busy')
+                if fbt in ['Free', 'NoData']:
                     continue
 
-                events.append({
-                    'start': start,
-                    'end': end,
-                    'subject': item.get('Subject', ''),
-                    'status': fbt,
-                })
-            except (ValueError, AttributeError):
-                continue
+                start_str = item.get('Start', '')
+                end_str = item.get('End', '')
 
-        # Check if there are more items
-        is_last = items[0].get('RootFolder', {}).get('IncludesLastItemInRange', True)
-        if is_last:
-            break
+                if not start_str or not end_str:
+                    continue
 
-        offset += batch_size
+                try:
+                    start = _parse_iso(start_str)
+                    end = _parse_iso(end_str)
+
+                    # Filter by date range
+                    if end.date() < start_date or start.date() > end_date:
+                        continue
+
+                    events.append({
+                        'start': start,
+                        'end': end,
+                        'subject': item.get('Subject', ''),
+                        'status': fbt,
+                    })
+                except (ValueError, AttributeError):
+                    continue
 
     return events
 
@@ -354,7 +401,7 @@ def find_free_time(
         sd = datetime.strptime(start_date, '%Y-%m-%d').date()
         ed = datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else sd
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date format: {e}"})
+        return dumps_json({"error": f"Invalid date format: {e}"})
 
     try:
         # Use GetUserAvailability for accurate recurring event expansion
@@ -364,35 +411,33 @@ def find_free_time(
             # Fallback to FindItem (misses recurring event occurrences)
             folder_id = _get_calendar_folder_id(client)
             if not folder_id:
-                return json.dumps({"error": "Could not find calendar folder. Session may have expired."})
+                return dumps_json({"error": "Could not find calendar folder. Session may have expired."})
             all_busy = _get_calendar_events(client, folder_id, sd, ed)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return dumps_json({"error": str(e)})
 
-    # Convert event dicts to (start, end) tuples for _find_free_slots
-    busy_periods = [(ev['start'], ev['end']) for ev in all_busy]
+    # Merge once for the whole range; _find_free_slots bisects per day
+    busy_periods = _merge_busy_periods([(ev['start'], ev['end']) for ev in all_busy])
 
+    day_start_time = time(hour=start_hour)
+    day_end_time = time(hour=end_hour)
     result = {}
-    current_date = sd
-    while current_date <= ed:
-        # Skip weekends
-        if current_date.weekday() < 5:
-            free = _find_free_slots(
-                busy_periods, current_date,
-                start_hour, end_hour, duration_minutes,
-            )
-            if free:
-                result[str(current_date)] = [
-                    {
-                        "start": _format_time(s),
-                        "end": _format_time(e),
-                        "duration_minutes": int((e - s).total_seconds() / 60),
-                    }
-                    for s, e in free
-                ]
-        current_date += timedelta(days=1)
-
-    return json.dumps({"free_slots": result}, ensure_ascii=False)
+    for day in _weekdays(sd, ed):
+        free = _find_free_slots(
+            busy_periods, day,
+            day_start_time, day_end_time, duration_minutes,
+        )
+        if free:
+            result[day.isoformat()] = [
+                {
+                    "start": _format_time(s),
+                    "end": _format_time(e),
+                    "duration_minutes": (e - s) // _MINUTE,
+                }
+                for s, e in free
+            ]
+
+    return dumps_json({"free_slots": result})
 
 
 # ------------------------------------------------------------------
@@ -432,22 +477,28 @@ def find_meeting_time(
 
     raw_list = [e.strip() for e in emails.split(',') if e.strip()]
     if not raw_list:
-        return json.dumps({"error": "No email addresses provided."})
+        return dumps_json({"error": "No email addresses provided."})
 
     try:
         sd = datetime.strptime(start_date, '%Y-%m-%d').date()
         ed = datetime.strptime(end_date, '%Y-%m-%d').date() if end_date else sd
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date format: {e}"})
+        return dumps_json({"error": f"Invalid date format: {e}"})
+    sd_iso = sd.isoformat()
+    ed_iso = ed.isoformat()
+
+    # Resolve names to email addresses via ResolveNames (looked up in parallel)
+    name_resolutions = client.resolve_names_many(
+        [e for e in raw_list if '@' not in e], full_contact=False,
+    )
 
-    # Resolve names to email addresses via ResolveNames
     email_list = []
     resolve_errors = []
     for entry in raw_list:
         if '@' in entry:
             email_list.append(entry)
         else:
-            resolutions = client.resolve_names(entry, full_contact=False)
+            resolutions = name_resolutions[entry]
             if resolutions:
                 addr = resolutions[0].get('Mailbox', {}).get('EmailAddress', '')
                 if addr:
@@ -458,34 +509,25 @@ def find_meeting_time(
                 resolve_errors.append(entry)
 
     if not email_list:
-        return json.dumps({"error": f"Could not resolve any names to email addresses: {resolve_errors}"})
+        return dumps_json({"error": f"Could not resolve any names to email addresses: {resolve_errors}"})
 
     # Build mailbox data (reused for each day chunk)
-    mailbox_data = []
-    for email in email_list:
-        mailbox_data.append({
+    mailbox_data = [
+        {
             '__type': 'MailboxData:#Exchange',
             'Email': {
                 '__type': 'EmailAddress:#Exchange',
                 'Address': email,
             },
             'AttendeeType': 'Required',
-        })
+        }
+        for email in email_list
+    ]
 
     # Query the full date range at once (API handles multi-day windows)
     payload = {
         '__type': 'GetUserAvailabilityJsonRequest:#Exchange',
-        'Header': {
-            '__type': 'JsonRequestHeaders:#Exchange',
-            'RequestServerVersion': 'Exchange2013',
-            'TimeZoneContext': {
-                '__type': 'TimeZoneContext:#Exchange',
-                'TimeZoneDefinition': {
-                    '__type': 'TimeZoneDefinitionType:#Exchange',
-                    'Id': 'Russian Standard Time',
-                },
-            },
-        },
+        'Header': _AVAILABILITY_HEADER,
         'Body': {
             '__type': 'GetUserAvailabilityRequest:#Exchange',
             'MailboxDataArray': mailbox_data,
@@ -493,7 +535,7 @@ def find_meeting_time(
                 '__type': 'FreeBusyViewOptions:#Exchange',
                 'TimeWindow': {
                     '__type': 'Duration:#Exchange',
-                    'StartTime': f'{sd}T00:00:00',
+                    'StartTime': f'{sd_iso}T00:00:00',
                     'EndTime': f'{ed + timedelta(days=1)}T00:00:00',
                 },
                 'MergedFreeBusyIntervalInMinutes': 30,
@@ -505,13 +547,14 @@ def find_meeting_time(
     try:
         data = client.request("GetUserAvailability", payload)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return dumps_json({"error": str(e)})
 
     body = data.get('Body', {})
     if 'ErrorCode' in body:
-        return json.dumps({"error": body.get('FaultMessage', 'Unknown error')})
+        return dumps_json({"error": body.get('FaultMessage', 'Unknown error')})
 
     # Parse availability responses
+    merged_fbs = []
     all_busy = []
     attendee_info = []
     freebusy_responses = body.get('FreeBusyResponseArray', [])
@@ -522,18 +565,16 @@ def find_meeting_time(
         email = email_list[i] if i < len(email_list) else f"Person {i+1}"
 
         if merged_fb:
-            start_time = datetime.combine(sd, datetime.min.time())
-            busy_periods = _parse_freebusy_string(merged_fb, start_time)
+            merged_fbs.append(merged_fb)
 
-            busy_count = sum(1 for c in merged_fb if c != '0')
-            free_count = sum(1 for c in merged_fb if c == '0')
+            free_count = merged_fb.count('0')
+            busy_count = len(merged_fb) - free_count
             attendee_info.append({
                 "email": email,
                 "busy_slots": busy_count,
                 "free_slots": free_count,
             })
 
-            all_busy.extend(busy_periods)
         else:
             # Fallback: parse CalendarEventArray
             cal_events_raw = fb_view.get('CalendarEventArray', {})
@@ -548,8 +589,8 @@ def find_meeting_time(
                     end_str = event.get('EndTime', '')
                     if start_str and end_str:
                         try:
-                            start = datetime.fromisoformat(start_str.replace('Z', '+00:00'))
-                            end = datetime.fromisoformat(end_str.replace('Z', '+00:00'))
+                            start = _parse_iso(start_str)
+                            end = _parse_iso(end_str)
                             all_busy.append((start, end))
                         except Exception:
                             pass
@@ -559,30 +600,42 @@ def find_meeting_time(
                     "status": "no_data",
                 })
 
-    merged_busy = _merge_busy_periods(all_busy)
+    # All MergedFreeBusy strings share the same 30-minute grid, so OR them
+    # into one bitmap and expand only its busy runs into periods
+    busy_runs = []
+    if merged_fbs:
+        start_time = datetime.combine(sd, datetime.min.time())
+        busy_runs = _parse_freebusy_string(_union_freebusy(merged_fbs), start_time)
+
+    if all_busy:
+        # CalendarEventArray fallbacks may overlap the bitmap runs
+        all_busy.extend(busy_runs)
+        merged_busy = _merge_busy_periods(all_busy)
+    else:
+        # Runs of the union bitmap are already sorted and disjoint
+        merged_busy = [(start, end) for start, end, _ in busy_runs]
 
     # Find free slots for each weekday in range
+    day_start_time = time(hour=start_hour)
+    day_end_time = time(hour=end_hour)
     free_by_date = {}
-    current_date = sd
-    while current_date <= ed:
-        if current_date.weekday() < 5:  # Skip weekends
-            free = _find_free_slots(
-                merged_busy, current_date,
-                start_hour, end_hour, duration_minutes,
-            )
-            if free:
-                free_by_date[str(current_date)] = [
-                    {
-                        "start": _format_time(s),
-                        "end": _format_time(e),
-                        "duration_minutes": int((e - s).total_seconds() / 60),
-                    }
-                    for s, e in free
-                ]
-        current_date += timedelta(days=1)
+    for day in _weekdays(sd, ed):
+        free = _find_free_slots(
+            merged_busy, day,
+            day_start_time, day_end_time, duration_minutes,
+        )
+        if free:
+            free_by_date[day.isoformat()] = [
+                {
+                    "start": _format_time(s),
+                    "end": _format_time(e),
+                    "duration_minutes": (e - s) // _MINUTE,
+                }
+                for s, e in free
+            ]
 
     result = {
-        "period": {"start": str(sd), "end": str(ed)},
+        "period": {"start": sd_iso, "end": ed_iso},
         "attendees": attendee_info,
         "free_slots": free_by_date,
     }
@@ -590,4 +643,4 @@ def find_meeting_time(
     if resolve_errors:
         result["unresolved"] = resolve_errors
 
-    return json.dumps(result, ensure_ascii=False)
+    return dumps_json(result)
@@ -4,16 +4,23 @@ Provides MCP tools for calendar event retrieval, meeting creation,
 update, cancellation, and meeting response management via OWA API.
 """
 
-import html as html_mod
-import json
+import os
+import random
+import re
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
 from datetime import datetime, timedelta
+from operator import itemgetter
+from pathlib import Path
 
 from mcp.server.fastmcp import Context
 
 from exchange_mcp.server import mcp, AppContext
 from exchange_mcp.owa_client import OWAClient
-from exchange_mcp.utils import html_to_text, parse_iso_datetime, extract_links_from_html
+from exchange_mcp.utils import dumps_json, html_to_text, parse_iso_datetime, extract_links_from_html
 
 
 def _get_client(ctx: Context) -> OWAClient:
@@ -26,6 +33,56 @@ def _get_client(ctx: Context) -> OWAClient:
 # Internal helpers
 # ------------------------------------------------------------------
 
+# Moscow is permanently UTC+3
+_MSK_OFFSET = timedelta(hours=3)
+
+# Max concurrent per-item requests (ResolveNames / GetItem) in one tool call
+_LOOKUP_CONCURRENCY = 8
+
+# GetItem ids per request when fetching event details in bulk
+_DETAILS_BATCH_SIZE = 50
+
+# Parsed event details keyed by (item id, ChangeKey); a changed item gets a
+# new ChangeKey, so entries never go stale and only need a size bound
+_DETAILS_CACHE: dict[tuple[str, str], dict] = {}
+_DETAILS_CACHE_SIZE = 1024
+_DETAILS_CACHE_LOCK = threading.Lock()
+
+# FindItem shape for get_calendar_events: only the fields matched and copied
+# into the result, instead of every property of every occurrence
+_CALENDAR_VIEW_SHAPE = {
+    "__type": "ItemResponseShape:#Exchange",
+    "BaseShape": "IdOnly",
+    "AdditionalProperties": [
+        {"__type": "PropertyUri:#Exchange", "FieldURI": field}
+        for field in (
+            "Subject", "Start", "End", "IsAllDayEvent", "IsCancelled", "MyResponseType",
+        )
+    ],
+}
+
+
+def _error_json(message: str) -> str:
+    """Return a tool error result: a JSON object with a single "error" key."""
+    return dumps_json({"error": message})
+
+
+def _parse_date(value: str, hour: int = 0, minute: int = 0) -> datetime:
+    """Parse a YYYY-MM-DD date (plus an optional time) without strptime."""
+    year, month, day = value.split("-")
+    return datetime(int(year), int(month), int(day), hour, minute)
+
+
+def _parse_hhmm(value: str) -> tuple[int, int]:
+    """Split an HH:MM time into (hour, minute)."""
+    hour, minute = value.split(":")
+    return int(hour), int(minute)
+
+
+def _ews_datetime(dt: datetime) -> str:
+    """Format a naive datetime as the YYYY-MM-DDTHH:MM:SS.000 form OWA sends."""
+    return dt.isoformat(timespec="seconds") + ".000"
+
 
 def _utc_to_local_str(dt_str: str) -> str:
     """Convert a UTC ISO timestamp to local Moscow time string.
@@ -38,38 +95,109 @@ def _utc_to_local_str(dt_str: str) -> str:
     if not dt_str:
         return dt_str
     if dt_str.endswith("Z"):
+        # Fast path for 'YYYY-MM-DDTHH:MM:SSZ' when the date does not roll over
+        if len(dt_str) == 20 and dt_str[11:13].isdigit():
+            hour = int(dt_str[11:13]) + 3
+            if hour < 24:
+                return f"{dt_str[:11]}{hour:02d}{dt_str[13:19]}"
         try:
-            utc_dt = datetime.strptime(dt_str, "%Y-%m-%dT%H:%M:%SZ")
-            local_dt = utc_dt + timedelta(hours=3)
-            return local_dt.strftime("%Y-%m-%dT%H:%M:%S")
+            local_dt = datetime.fromisoformat(dt_str[:-1]) + _MSK_OFFSET
+            return local_dt.isoformat(timespec="seconds")
         except ValueError:
             return dt_str.rstrip("Z")
     # No timezone suffix — already local time
     return dt_str
 
 
-def _get_event_details(client: OWAClient, item_id: str) -> dict:
-    """Get full event details (body, organizer, attendees) via GetItem."""
-    payload = {
+# Shared read-only fragments of the AllProperties GetItem request
+_REQUEST_HEADER = {
+    "__type": "JsonRequestHeaders:#Exchange",
+    "RequestServerVersion": "Exchange2013",
+}
+_ALL_PROPERTIES_SHAPE = {
+    "__type": "ItemResponseShape:#Exchange",
+    "BaseShape": "AllProperties",
+}
+
+
+# GetItem shape for update_meeting: only the fields it carries over from the
+# original meeting, which leaves out the rest of AllProperties
+_UPDATE_SOURCE_SHAPE = {
+    "__type": "ItemResponseShape:#Exchange",
+    "BaseShape": "IdOnly",
+    "AdditionalProperties": [
+        {"__type": "PropertyUri:#Exchange", "FieldURI": field}
+        for field in (
+            "Subject", "Start", "End", "IsAllDayEvent", "Sensitivity", "Location",
+            "EnhancedLocation", "Body", "RequiredAttendees", "OptionalAttendees",
+        )
+    ],
+}
+
+# GetItem shape for download_event_attachments: the attachment list only
+_ATTACHMENTS_SHAPE = {
+    "__type": "ItemResponseShape:#Exchange",
+    "BaseShape": "IdOnly",
+    "AdditionalProperties": [
+        {"__type": "PropertyUri:#Exchange", "FieldURI": "Attachments"},
+    ],
+}
+
+
+def _get_item_payload(item_ids: list[str], shape: dict = _ALL_PROPERTIES_SHAPE) -> dict:
+    """Build a GetItem request for the given item IDs (AllProperties by default)."""
+    return {
         "__type": "GetItemJsonRequest:#Exchange",
-        "Header": {
-            "__type": "JsonRequestHeaders:#Exchange",
-            "RequestServerVersion": "Exchange2013",
-        },
+        "Header": _REQUEST_HEADER,
         "Body": {
             "__type": "GetItemRequest:#Exchange",
-            "ItemShape": {
-                "__type": "ItemResponseShape:#Exchange",
-                "BaseShape": "AllProperties",
-            },
+            "ItemShape": shape,
             "ItemIds": [
-                {"__type": "ItemId:#Exchange", "Id": item_id}
+                {"__type": "ItemId:#Exchange", "Id": item_id} for item_id in item_ids
             ],
         },
     }
 
-    data = client.request("GetItem", payload)
-    result = {
+
+def _format_attendee_entry(attendee: dict) -> str | None:
+    """Format a GetItem attendee as 'Name <addr> [Response]'.
+
+    The address is left out when it is not SMTP (legacy '/O=' DN); returns
+    None when the attendee has neither a name nor an address.
+    """
+    mailbox = attendee.get("Mailbox", {})
+    name = mailbox.get("Name", "")
+    addr = mailbox.get("EmailAddress", "")
+    if not (name or addr):
+        return None
+    if addr and not addr.startswith("/O="):
+        entry = name + " <" + addr + ">" if name else addr
+    else:
+        entry = name
+    response = attendee.get("ResponseType", "")
+    if response and response not in ("Unknown", "Organizer"):
+        entry += " [" + response + "]"
+    return entry
+
+
+def _smtp_attendee(attendee: dict) -> dict | None:
+    """Convert a GetItem attendee to a resolved attendee dict, or None if not SMTP."""
+    mailbox = attendee.get("Mailbox", {})
+    addr = mailbox.get("EmailAddress", "")
+    if not addr or addr.startswith("/O="):
+        return None
+    return {
+        "Mailbox": {
+            "Name": mailbox.get("Name", ""),
+            "EmailAddress": addr,
+            "RoutingType": "SMTP",
+        }
+    }
+
+
+def _empty_event_details() -> dict:
+    """Default event details used when GetItem returns no item."""
+    return {
         "organizer": "",
         "organizer_email": "",
         "location": "",
@@ -78,99 +206,119 @@ def _get_event_details(client: OWAClient, item_id: str) -> dict:
         "attendees_optional": [],
     }
 
-    for msg in client.extract_items(data):
-        if "Items" not in msg:
-            continue
-        for item in msg["Items"]:
-            # Location
-            result["location"] = item.get("Location", "")
-            if not result["location"]:
-                enhanced = item.get("EnhancedLocation", {})
-                if enhanced:
-                    result["location"] = enhanced.get("DisplayName", "")
 
-            # Body
-            body_data = item.get("Body", {})
-            if body_data:
-                body_text = body_data.get("Value", "")
-                if body_data.get("BodyType") == "HTML":
-                    body_text = html_to_text(body_text)
-                result["body"] = body_text.strip()
-
-            # Organizer with SMTP email
-            organizer = item.get("Organizer", {}).get("Mailbox", {})
-            if organizer:
-                name = organizer.get("Name", "")
-                addr = organizer.get("EmailAddress", "")
-                if addr and not addr.startswith("/O="):
-                    result["organizer"] = f"{name} <{addr}>" if name else addr
-                    result["organizer_email"] = addr
-                else:
-                    result["organizer"] = name
-
-            # Required attendees with SMTP emails
-            for a in item.get("RequiredAttendees", []) or []:
-                mailbox = a.get("Mailbox", {})
-                name = mailbox.get("Name", "")
-                addr = mailbox.get("EmailAddress", "")
-                response = a.get("ResponseType", "")
-
-                if name or addr:
-                    if addr and not addr.startswith("/O="):
-                        entry = f"{name} <{addr}>" if name else addr
-                    else:
-                        entry = name
-                    if response and response not in ("Unknown", "Organizer"):
-                        entry += f" [{response}]"
-                    result["attendees_required"].append(entry)
-
-            # Optional attendees with SMTP emails
-            for a in item.get("OptionalAttendees", []) or []:
-                mailbox = a.get("Mailbox", {})
-                name = mailbox.get("Name", "")
-                addr = mailbox.get("EmailAddress", "")
-                response = a.get("ResponseType", "")
-
-                if name or addr:
-                    if addr and not addr.startswith("/O="):
-                        entry = f"{name} <{addr}>" if name else addr
-                    else:
-                        entry = name
-                    if response and response not in ("Unknown", "Organizer"):
-                        entry += f" [{response}]"
-                    result["attendees_optional"].append(entry)
-
-            return result
+def _parse_event_details(item: dict) -> dict:
+    """Extract body, organizer, location and attendees from a GetItem item."""
+    result = _empty_event_details()
+
+    # Location
+    result["location"] = item.get("Location", "")
+    if not result["location"]:
+        enhanced = item.get("EnhancedLocation", {})
+        if enhanced:
+            result["location"] = enhanced.get("DisplayName", "")
+
+    # Body
+    body_data = item.get("Body")
+    if body_data:
+        raw = body_data.get("Value", "")
+        if raw:
+            if body_data.get("BodyType") == "HTML":
+                raw = html_to_text(raw)
+            result["body"] = raw.strip()
+
+    # Organizer with SMTP email
+    organizer = item.get("Organizer", {}).get("Mailbox", {})
+    if organizer:
+        name = organizer.get("Name", "")
+        addr = organizer.get("EmailAddress", "")
+        if addr and not addr.startswith("/O="):
+            result["organizer"] = f"{name} <{addr}>" if name else addr
+            result["organizer_email"] = addr
+        else:
+            result["organizer"] = name
+
+    # Attendees with SMTP emails
+    result["attendees_required"] = [
+        entry for entry in map(_format_attendee_entry, item.get("RequiredAttendees") or [])
+        if entry is not None
+    ]
+    result["attendees_optional"] = [
+        entry for entry in map(_format_attendee_entry, item.get("OptionalAttendees") or [])
+        if entry is not None
+    ]
 
     return result
 
 
+def _get_event_details_bulk(
+    client: OWAClient, item_ids: list[str], change_keys: dict[str, str] | None = None
+) -> dict[str, dict]:
+    """Get full event details for many events via batched GetItem calls.
+
+    GetItem accepts a list of ItemIds and answers with one response message
+    per id, in request order. Ids whose message carries no item map to empty
+    details. Batches of ``_DETAILS_BATCH_SIZE`` ids are sent concurrently.
+
+    When ``change_keys`` gives an id's current ChangeKey, details are reused
+    from ``_DETAILS_CACHE`` (the key rotates whenever the item is modified)
+    and only the remaining ids are requested.
+    """
+    change_keys = change_keys or {}
+    details: dict[str, dict] = {}
+    missing = []
+    with _DETAILS_CACHE_LOCK:
+        for item_id in item_ids:
+            cached = _DETAILS_CACHE.get((item_id, change_keys.get(item_id)))
+            if cached is not None:
+                details[item_id] = cached
+            else:
+                missing.append(item_id)
+
+    def fetch(batch: list[str]) -> list[dict | None]:
+        data = client.request("GetItem", _get_item_payload(batch))
+        return [
+            _parse_event_details(msg["Items"][0]) if msg.get("Items") else None
+            for msg in client.extract_items(data)
+        ]
+
+    batches = [
+        missing[i:i + _DETAILS_BATCH_SIZE]
+        for i in range(0, len(missing), _DETAILS_BATCH_SIZE)
+    ]
+    if len(batches) <= 1:
+        results = [fetch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(_LOOKUP_CONCURRENCY, len(batches))
+        ) as pool:
+            results = list(pool.map(fetch, batches))
+
+    with _DETAILS_CACHE_LOCK:
+        for batch, parsed in zip(batches, results):
+            for item_id, item_details in zip(batch, parsed):
+                if item_details is None:
+                    details[item_id] = _empty_event_details()
+                    continue
+                details[item_id] = item_details
+                change_key = change_keys.get(item_id)
+                if change_key:
+                    if len(_DETAILS_CACHE) >= _DETAILS_CACHE_SIZE:
+                        # Evict the oldest entry (dicts keep insertion order)
+                        _DETAILS_CACHE.pop(next(iter(_DETAILS_CACHE)))
+                    _DETAILS_CACHE[(item_id, change_key)] = item_details
+    return details
+
+
 def _get_full_event(client: OWAClient, item_id: str) -> dict:
     """Get full event details for update_meeting preservation."""
-    payload = {
-        "__type": "GetItemJsonRequest:#Exchange",
-        "Header": {
-            "__type": "JsonRequestHeaders:#Exchange",
-            "RequestServerVersion": "Exchange2013",
-        },
-        "Body": {
-            "__type": "GetItemRequest:#Exchange",
-            "ItemShape": {
-                "__type": "ItemResponseShape:#Exchange",
-                "BaseShape": "AllProperties",
-            },
-            "ItemIds": [
-                {"__type": "ItemId:#Exchange", "Id": item_id}
-            ],
-        },
-    }
-
-    data = client.request("GetItem", payload)
+    data = client.request("GetItem", _get_item_payload([item_id], _UPDATE_SOURCE_SHAPE))
     for msg in client.extract_items(data):
         if "Items" not in msg:
             continue
         for item in msg["Items"]:
             result = {
+                "change_key": item.get("ItemId", {}).get("ChangeKey", ""),
                 "subject": item.get("Subject", ""),
                 "start": item.get("Start", ""),
                 "end": item.get("End", ""),
@@ -195,33 +343,15 @@ def _get_full_event(client: OWAClient, item_id: str) -> dict:
             if body_data:
                 result["body_html"] = body_data.get("Value", "")
 
-            # Required attendees as resolved dicts
-            for a in item.get("RequiredAttendees", []) or []:
-                mailbox = a.get("Mailbox", {})
-                name = mailbox.get("Name", "")
-                addr = mailbox.get("EmailAddress", "")
-                if addr and not addr.startswith("/O="):
-                    result["resolved_required"].append({
-                        "Mailbox": {
-                            "Name": name,
-                            "EmailAddress": addr,
-                            "RoutingType": "SMTP",
-                        }
-                    })
-
-            # Optional attendees
-            for a in item.get("OptionalAttendees", []) or []:
-                mailbox = a.get("Mailbox", {})
-                name = mailbox.get("Name", "")
-                addr = mailbox.get("EmailAddress", "")
-                if addr and not addr.startswith("/O="):
-                    result["resolved_optional"].append({
-                        "Mailbox": {
-                            "Name": name,
-                            "EmailAddress": addr,
-                            "RoutingType": "SMTP",
-                        }
-                    })
+            # Attendees as resolved dicts (SMTP addresses only)
+            result["resolved_required"] = [
+                resolved for resolved in map(_smtp_attendee, item.get("RequiredAttendees") or [])
+                if resolved is not None
+            ]
+            result["resolved_optional"] = [
+                resolved for resolved in map(_smtp_attendee, item.get("OptionalAttendees") or [])
+                if resolved is not None
+            ]
 
             return result
 
@@ -265,6 +395,11 @@ def _resolve_attendee(client: OWAClient, email: str) -> dict:
         pass
 
     # Fallback
+    return _address_attendee(email)
+
+
+def _address_attendee(email: str) -> dict:
+    """Build an attendee dict for a bare SMTP address."""
     return {
         "Mailbox": {
             "Name": email,
@@ -274,35 +409,240 @@ def _resolve_attendee(client: OWAClient, email: str) -> dict:
     }
 
 
+# A bare user@domain.tld address: no display name, angle brackets,
+# whitespace or empty domain labels
+_SMTP_ADDRESS_RE = re.compile(r"[^@\s<>]+@[^@\s<>.]+(?:\.[^@\s<>.]+)+")
+
+
+def _is_smtp_address(value: str) -> bool:
+    """True for bare addresses shaped like user@domain.tld."""
+    return _SMTP_ADDRESS_RE.fullmatch(value) is not None
+
+
 def _resolve_attendee_list(client: OWAClient, emails: list[str]) -> list[dict]:
-    """Resolve a list of email strings into attendee dicts."""
-    attendees = []
-    for email in emails:
-        email = email.strip()
-        if email:
-            attendees.append(_resolve_attendee(client, email))
+    """Resolve a list of email strings into attendee dicts.
+
+    SMTP addresses are used as-is (Exchange matches them against the
+    directory when it saves the item). Anything else, such as a display
+    name or alias, needs its own ResolveNames request; those are issued
+    concurrently. The result keeps the input order.
+    """
+    emails = [email for email in (e.strip() for e in emails) if email]
+    attendees = [_address_attendee(email) if _is_smtp_address(email) else None for email in emails]
+    pending = [i for i, attendee in enumerate(attendees) if attendee is None]
+    if len(pending) == 1:
+        attendees[pending[0]] = _resolve_attendee(client, emails[pending[0]])
+    elif pending:
+        with ThreadPoolExecutor(max_workers=min(_LOOKUP_CONCURRENCY, len(pending))) as pool:
+            resolved = pool.map(lambda i: _resolve_attendee(client, emails[i]), pending)
+            for i, attendee in zip(pending, resolved):
+                attendees[i] = attendee
     return attendees
 
 
+# HTML body skeleton for calendar items, matching create-meeting.py
+_HTML_BODY_PREFIX = (
+    '<html><head><meta http-equiv="Content-Type" '
+    'content="text/html; charset=UTF-8"></head><body dir="ltr">'
+    '<div style="font-size:12pt;color:#000000;'
+    'font-family:Calibri,Helvetica,sans-serif;">'
+)
+_HTML_BODY_SUFFIX = "</div></body></html>"
+_HTML_BODY_EMPTY = f"{_HTML_BODY_PREFIX}<p><br></p>{_HTML_BODY_SUFFIX}"
+
+# html.escape() (quote=True) plus newline -> <br>, applied in one pass
+_HTML_BODY_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+    "\n": "<br>",
+})
+
+
 def _build_html_body(description: str | None) -> str:
     """Build the HTML body for a calendar item, matching create-meeting.py."""
-    body = (
-        '<html><head><meta http-equiv="Content-Type" '
-        'content="text/html; charset=UTF-8"></head><body dir="ltr">'
-    )
-    if description:
-        desc_escaped = html_mod.escape(description).replace("\n", "<br>")
-        body += (
-            '<div style="font-size:12pt;color:#000000;'
-            f'font-family:Calibri,Helvetica,sans-serif;">{desc_escaped}</div>'
-        )
-    else:
-        body += (
-            '<div style="font-size:12pt;color:#000000;'
-            'font-family:Calibri,Helvetica,sans-serif;"><p><br></p></div>'
-        )
-    body += "</body></html>"
-    return body
+    if not description:
+        return _HTML_BODY_EMPTY
+    return f"{_HTML_BODY_PREFIX}{description.translate(_HTML_BODY_TABLE)}{_HTML_BODY_SUFFIX}"
+
+
+# Static parts of the CreateCalendarEvent request (V2017_08_18, Moscow time)
+_CREATE_EVENT_HEADER = OWAClient.encode_json({
+    "__type": "JsonRequestHeaders:#Exchange",
+    "RequestServerVersion": "V2017_08_18",
+    "TimeZoneContext": {
+        "__type": "TimeZoneContext:#Exchange",
+        "TimeZoneDefinition": {
+            "__type": "TimeZoneDefinitionType:#Exchange",
+            "Id": "Russian Standard Time",
+        },
+    },
+})
+_CALENDAR_TARGET_FOLDER = {
+    "__type": "TargetFolderId:#Exchange",
+    "BaseFolderId": {
+        "__type": "DistinguishedFolderId:#Exchange",
+        "Id": "calendar",
+    },
+}
+_LOCATION_POSTAL_ADDRESS = {
+    "__type": "PersonaPostalAddress:#Exchange",
+    "Type": "Business",
+    "LocationSource": "None",
+}
+_LOCATION_TEMPLATE = {
+    "__type": "EnhancedLocation:#Exchange",
+    "Annotation": "",
+    "PostalAddress": _LOCATION_POSTAL_ADDRESS,
+}
+# CalendarItem fields every created meeting shares
+_CALENDAR_ITEM_TEMPLATE = {
+    "__type": "CalendarItem:#Exchange",
+    "ReminderIsSet": True,
+    "IsResponseRequested": True,
+    "DoNotForwardMeeting": False,
+    "FreeBusyType": "Busy",
+    "unfoldedIndex": 0,
+}
+# DeleteItem request that cancels meetings; only ItemIds varies
+_CANCEL_MEETINGS_TEMPLATE = {
+    "__type": "DeleteItemJsonRequest:#Exchange",
+    "Header": _REQUEST_HEADER,
+    "Body": {
+        "__type": "DeleteItemRequest:#Exchange",
+        "DeleteType": "MoveToDeletedItems",
+        "SendMeetingCancellations": "SendToAllAndSaveCopy",
+        "SuppressReadReceipts": True,
+    },
+}
+
+
+def _cancel_meetings_payload(item_ids: list[str]) -> dict:
+    """Build the DeleteItem request that cancels meetings and notifies attendees."""
+    return {
+        **_CANCEL_MEETINGS_TEMPLATE,
+        "Body": {
+            **_CANCEL_MEETINGS_TEMPLATE["Body"],
+            "ItemIds": [
+                {"__type": "ItemId:#Exchange", "Id": item_id} for item_id in item_ids
+            ],
+        },
+    }
+
+
+# ClientSeriesId is only a client-side correlation id, so it is drawn from
+# a private PRNG (seeded from os.urandom once) rather than os.urandom per call
+_SERIES_ID_RNG = random.Random()
+
+
+def _new_series_id() -> str:
+    """Return a random version-4 UUID string for ClientSeriesId."""
+    return str(uuid.UUID(int=_SERIES_ID_RNG.getrandbits(128), version=4))
+
+
+def _build_create_event_payload(
+    *,
+    subject: str,
+    html_body: str,
+    sensitivity: str,
+    reminder_minutes: int,
+    is_all_day: bool,
+    start: datetime,
+    end: datetime,
+    location: str,
+    required: list[dict],
+    optional: list[dict],
+    importance: str = "Normal",
+) -> bytes:
+    """Build the serialized CreateCalendarEvent request for create/update_meeting."""
+    calendar_item = {
+        **_CALENDAR_ITEM_TEMPLATE,
+        "ClientSeriesId": _new_series_id(),
+        "Subject": subject,
+        "Body": {
+            "__type": "BodyContentType:#Exchange",
+            "BodyType": "HTML",
+            "Value": html_body,
+        },
+        "Sensitivity": sensitivity,
+        "ReminderMinutesBeforeStart": reminder_minutes,
+        "IsAllDayEvent": is_all_day,
+        "Start": _ews_datetime(start),
+        "End": _ews_datetime(end),
+        "Location": {**_LOCATION_TEMPLATE, "DisplayName": location},
+    }
+
+    if importance != "Normal":
+        calendar_item["Importance"] = importance
+
+    if required:
+        calendar_item["RequiredAttendees"] = required
+    if optional:
+        calendar_item["OptionalAttendees"] = optional
+
+    body = {
+        "__type": "CreateItemRequest:#Exchange",
+        "Items": [calendar_item],
+        "ClientSupportsIrm": True,
+        "SavedItemFolderId": _CALENDAR_TARGET_FOLDER,
+    }
+
+    # Send invitations if there are attendees
+    if required or optional:
+        body["SendMeetingInvitations"] = "SendToAllAndSaveCopy"
+
+    return OWAClient.json_request_body("CreateItemJsonRequest:#Exchange", _CREATE_EVENT_HEADER, body)
+
+
+# UpdateItem ResponseCodes meaning the requested changes cannot be applied to
+# the item in place; only these trigger update_meeting's cancel+create fallback
+_UPDATE_UNSUPPORTED_CODES = frozenset({
+    "ErrorInvalidPropertySet",
+    "ErrorInvalidPropertyForOperation",
+    "ErrorInvalidPropertyRequest",
+    "ErrorUnsupportedPathForSet",
+    "ErrorUnsupportedPropertyDefinition",
+    "ErrorUpdatePropertyMismatch",
+})
+
+
+def _build_update_event_payload(item_id: str, change_key: str, fields: dict) -> bytes:
+    """Build the serialized UpdateItem request for update_meeting.
+
+    ``fields`` maps CalendarItem property names to their new values; empty
+    lists clear the property. Updates go out to attendees.
+    """
+    updates = []
+    for field, value in fields.items():
+        path = {"__type": "PropertyUri:#Exchange", "FieldURI": field}
+        if value == []:
+            updates.append({"__type": "DeleteItemField:#Exchange", "Path": path})
+        else:
+            updates.append({
+                "__type": "SetItemField:#Exchange",
+                "Path": path,
+                "Item": {"__type": "CalendarItem:#Exchange", field: value},
+            })
+
+    item_id_dict = {"__type": "ItemId:#Exchange", "Id": item_id}
+    if change_key:
+        item_id_dict["ChangeKey"] = change_key
+
+    body = {
+        "__type": "UpdateItemRequest:#Exchange",
+        "ItemChanges": [
+            {
+                "__type": "ItemChange:#Exchange",
+                "ItemId": item_id_dict,
+                "Updates": updates,
+            }
+        ],
+        "ConflictResolution": "AutoResolve",
+        "SendMeetingInvitationsOrCancellations": "SendToAllAndSaveCopy",
+    }
+    return OWAClient.json_request_body("UpdateItemJsonRequest:#Exchange", _CREATE_EVENT_HEADER, body)
 
 
 # ------------------------------------------------------------------
@@ -310,6 +650,132 @@ def _build_html_body(description: str | None) -> str:
 # ------------------------------------------------------------------
 
 
+# Expanded-events cache: (mailbox, chunk start, chunk end) -> (expiry
+# (monotonic), events). The user's own calendar changes often, so entries
+# live briefly and the meeting mutation tools drop them for their mailbox.
+_EXPANDED_CACHE: dict[tuple, tuple[float, list[dict]]] = {}
+_EXPANDED_CACHE_TTL_DEFAULT = 120.0
+
+
+def _expanded_cache_ttl() -> float:
+    """Read EXCHANGE_CALENDAR_CACHE_TTL, falling back to the default if invalid."""
+    raw = os.environ.get("EXCHANGE_CALENDAR_CACHE_TTL", "")
+    try:
+        ttl = float(raw) if raw.strip() else _EXPANDED_CACHE_TTL_DEFAULT
+    except ValueError:
+        ttl = _EXPANDED_CACHE_TTL_DEFAULT
+    if ttl != ttl:  # NaN
+        ttl = _EXPANDED_CACHE_TTL_DEFAULT
+    return max(0.0, ttl)
+
+
+_EXPANDED_CACHE_TTL = _expanded_cache_ttl()
+_EXPANDED_CACHE_SIZE = 256
+_EXPANDED_CACHE_LOCK = threading.Lock()
+
+# Serialized GetUserAvailability header (Exchange2013, Moscow time zone)
+_AVAILABILITY_HEADER = OWAClient.encode_json({
+    '__type': 'JsonRequestHeaders:#Exchange',
+    'RequestServerVersion': 'Exchange2013',
+    'TimeZoneContext': {
+        '__type': 'TimeZoneContext:#Exchange',
+        'TimeZoneDefinition': {
+            '__type': 'TimeZoneDefinitionType:#Exchange',
+            'Id': 'Russian Standard Time',
+        },
+    },
+})
+
+
+def _invalidate_expanded_events(client: OWAClient) -> None:
+    """Forget cached expanded events and meeting analytics for the client's mailbox."""
+    mailbox = (client.user_email or "").lower()
+    with _EXPANDED_CACHE_LOCK:
+        for key in [k for k in _EXPANDED_CACHE if k[0] == mailbox]:
+            del _EXPANDED_CACHE[key]
+    # Imported here so importing calendar does not register the analytics
+    # tools ahead of its own
+    from exchange_mcp.tools.analytics import invalidate_availability_cache
+
+    invalidate_availability_cache(mailbox)
+
+
+def _fetch_expanded_chunk(client: OWAClient, chunk_start, chunk_end) -> list[dict]:
+    """Get one window's expanded events via GetUserAvailability.
+
+    Results are cached for ``_EXPANDED_CACHE_TTL`` seconds; a failed
+    request yields an empty list so the other windows still return.
+    """
+    key = (client.user_email.lower(), chunk_start, chunk_end)
+    with _EXPANDED_CACHE_LOCK:
+        cached = _EXPANDED_CACHE.get(key)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
+    payload = OWAClient.json_request_body(
+        'GetUserAvailabilityJsonRequest:#Exchange',
+        _AVAILABILITY_HEADER,
+        {
+            '__type': 'GetUserAvailabilityRequest:#Exchange',
+            'MailboxDataArray': [{
+                '__type': 'MailboxData:#Exchange',
+                'Email': {'__type': 'EmailAddress:#Exchange', 'Address': client.user_email},
+                'AttendeeType': 'Required',
+            }],
+            'FreeBusyViewOptions': {
+                '__type': 'FreeBusyViewOptions:#Exchange',
+                'TimeWindow': {
+                    '__type': 'Duration:#Exchange',
+                    'StartTime': f'{chunk_start}T00:00:00',
+                    'EndTime': f'{chunk_end}T00:00:00',
+                },
+                'MergedFreeBusyIntervalInMinutes': 30,
+                'RequestedView': 'DetailedMerged',
+            },
+        },
+    )
+
+    try:
+        data = client.request('GetUserAvailability', payload)
+        body = data.get('Body', {})
+        chunk_events = []
+        for fb_resp in body.get('FreeBusyResponseArray', []):
+            fb_view = fb_resp.get('FreeBusyView', {})
+            cal_events = fb_view.get('CalendarEventArray', {})
+            items = (
+                cal_events.get('Items', [])
+                if isinstance(cal_events, dict)
+                else (cal_events if isinstance(cal_events, list) else [])
+            )
+            for event in items:
+                bt = event.get('BusyType', '')
+                details = event.get('CalendarEventDetails', {})
+                subject = details.get('Subject', '') if details else ''
+                location = details.get('Location', '') if details else ''
+                is_meeting = details.get('IsMeeting', False) if details else False
+                is_recurring = details.get('IsRecurring', False) if details else False
+
+                chunk_events.append({
+                    'subject': subject or '(No subject)',
+                    'start': event.get('StartTime', ''),
+                    'end': event.get('EndTime', ''),
+                    'busy_type': bt,
+                    'location': location,
+                    'is_meeting': is_meeting,
+                    'is_recurring': is_recurring,
+                })
+    except Exception:
+        return []
+
+    if 'ErrorCode' not in body:
+        with _EXPANDED_CACHE_LOCK:
+            if key not in _EXPANDED_CACHE and len(_EXPANDED_CACHE) >= _EXPANDED_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                _EXPANDED_CACHE.pop(next(iter(_EXPANDED_CACHE)))
+            _EXPANDED_CACHE[key] = (time.monotonic() + _EXPANDED_CACHE_TTL, chunk_events)
+    return chunk_events
+
+
 def _get_expanded_events(
     client: OWAClient, start_date, end_date, chunk_days: int = 14
 ) -> list[dict]:
@@ -319,83 +785,88 @@ def _get_expanded_events(
     this returns every individual occurrence within the date range.
 
     Requires client.user_email to be set (done by the login tool).
+    The range is split into ``chunk_days`` windows that are fetched
+    concurrently.
     """
     if not client.user_email:
         return []
 
-    expanded = []
+    windows = []
     current = start_date
-
     while current < end_date:
         chunk_end = min(current + timedelta(days=chunk_days), end_date)
+        windows.append((current, chunk_end))
+        current = chunk_end
 
-        payload = {
-            '__type': 'GetUserAvailabilityJsonRequest:#Exchange',
-            'Header': {
-                '__type': 'JsonRequestHeaders:#Exchange',
-                'RequestServerVersion': 'Exchange2013',
-                'TimeZoneContext': {
-                    '__type': 'TimeZoneContext:#Exchange',
-                    'TimeZoneDefinition': {
-                        '__type': 'TimeZoneDefinitionType:#Exchange',
-                        'Id': 'Russian Standard Time',
-                    },
-                },
-            },
-            'Body': {
-                '__type': 'GetUserAvailabilityRequest:#Exchange',
-                'MailboxDataArray': [{
-                    '__type': 'MailboxData:#Exchange',
-                    'Email': {'__type': 'EmailAddress:#Exchange', 'Address': client.user_email},
-                    'AttendeeType': 'Required',
-                }],
-                'FreeBusyViewOptions': {
-                    '__type': 'FreeBusyViewOptions:#Exchange',
-                    'TimeWindow': {
-                        '__type': 'Duration:#Exchange',
-                        'StartTime': f'{current}T00:00:00',
-                        'EndTime': f'{chunk_end}T00:00:00',
-                    },
-                    'MergedFreeBusyIntervalInMinutes': 30,
-                    'RequestedView': 'DetailedMerged',
-                },
-            },
-        }
+    if len(windows) <= 1:
+        chunks = [_fetch_expanded_chunk(client, *window) for window in windows]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(_LOOKUP_CONCURRENCY, len(windows))
+        ) as pool:
+            chunks = list(pool.map(lambda window: _fetch_expanded_chunk(client, *window), windows))
+
+    expanded = [ev for chunk in chunks for ev in chunk]
+    return sorted(expanded, key=itemgetter('start'))
+
+
+# The FindItem fields get_calendar_events reads, kept per occurrence instead
+# of the whole item dict
+_FIRow = namedtuple("_FIRow", "start end all_day cancelled my_resp item_id change_key")
+
+
+def _finditem_row(item: dict) -> _FIRow:
+    """Reduce a FindItem CalendarView occurrence to a _FIRow."""
+    item_id = item.get("ItemId", {})
+    return _FIRow(
+        item.get("Start"),
+        item.get("End"),
+        item.get("IsAllDayEvent", False),
+        item.get("IsCancelled", False),
+        item.get("MyResponseType", ""),
+        item_id.get("Id", ""),
+        item_id.get("ChangeKey", ""),
+    )
 
-        try:
-            data = client.request('GetUserAvailability', payload)
-            body = data.get('Body', {})
-            for fb_resp in body.get('FreeBusyResponseArray', []):
-                fb_view = fb_resp.get('FreeBusyView', {})
-                cal_events = fb_view.get('CalendarEventArray', {})
-                items = (
-                    cal_events.get('Items', [])
-                    if isinstance(cal_events, dict)
-                    else (cal_events if isinstance(cal_events, list) else [])
-                )
-                for event in items:
-                    bt = event.get('BusyType', '')
-                    details = event.get('CalendarEventDetails', {})
-                    subject = details.get('Subject', '') if details else ''
-                    location = details.get('Location', '') if details else ''
-                    is_meeting = details.get('IsMeeting', False) if details else False
-                    is_recurring = details.get('IsRecurring', False) if details else False
-
-                    expanded.append({
-                        'subject': subject or '(No subject)',
-                        'start': event.get('StartTime', ''),
-                        'end': event.get('EndTime', ''),
-                        'busy_type': bt,
-                        'location': location,
-                        'is_meeting': is_meeting,
-                        'is_recurring': is_recurring,
-                    })
-        except Exception:
-            pass
 
-        current = chunk_end
+def _merge_event(ev: dict, fi: _FIRow | None) -> dict:
+    """Build a get_calendar_events entry from an expanded event.
 
-    return sorted(expanded, key=lambda x: x.get('start', ''))
+    ``fi`` is the matching FindItem occurrence, if any; it supplies the
+    item_id and the UTC start/end, all-day, cancelled and response fields.
+    """
+    start = ev.get("start", "")
+    end = ev.get("end", "")
+    if fi is None:
+        item_id = ""
+        is_all_day = is_cancelled = False
+        my_response = ""
+    else:
+        item_id = fi.item_id
+        if fi.start is not None:
+            start = fi.start
+        if fi.end is not None:
+            end = fi.end
+        is_all_day = fi.all_day
+        is_cancelled = fi.cancelled
+        my_response = fi.my_resp
+
+    return {
+        "subject": ev.get("subject", "(No subject)"),
+        "start": start,
+        "end": end,
+        "location": ev.get("location", ""),
+        "is_all_day": is_all_day,
+        "is_cancelled": is_cancelled,
+        "is_meeting": ev.get("is_meeting", False),
+        "is_recurring": ev.get("is_recurring", False),
+        "organizer": "",
+        "my_response": my_response,
+        "item_id": item_id,
+        "body": "",
+        "attendees_required": [],
+        "attendees_optional": [],
+    }
 
 
 @mcp.tool()
@@ -428,7 +899,7 @@ def get_calendar_events(
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date, "%Y-%m-%d")
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date format: {e}"})
+        return _error_json(f"Invalid date format: {e}")
 
     # --- Expanded mode: uses GetUserAvailability for accurate recurring counts ---
     if expand_recurring:
@@ -446,109 +917,97 @@ def get_calendar_events(
                 "is_meeting": ev.get('is_meeting', False),
                 "is_recurring": ev.get('is_recurring', False),
             })
-        return json.dumps(events, ensure_ascii=False)
+        return dumps_json(events)
 
     # --- Default mode ---
-    # Step 1: Get all events (including recurring) via GetUserAvailability
-    expanded = _get_expanded_events(
-        client, start_dt.date(), (end_dt + timedelta(days=1)).date()
-    )
-
-    # Step 2: Get events with item_ids via FindItem + CalendarView.
-    # CalendarView restricts results to the date range and expands recurring
-    # events into individual occurrences (each with its own ItemId).
-    folder_id = client.get_folder_id("calendar")
-    finditem_by_key: dict[str, dict] = {}  # "subject|start" -> item
-    if folder_id:
-        cv_start = start_dt.strftime("%Y-%m-%dT00:00:00")
-        cv_end = (end_dt + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00")
+    # Step 1: Get all events (including recurring) via GetUserAvailability.
+    # It does not depend on step 2, so it runs on a worker thread (sharing
+    # the client's pooled keep-alive connections) while FindItem proceeds.
+    # Leaving the block waits for it, so an error in step 2 never leaves a
+    # stray request running.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        expanded_future = pool.submit(
+            _get_expanded_events, client, start_dt.date(), (end_dt + timedelta(days=1)).date()
+        )
 
-        payload = {
-            "__type": "FindItemJsonRequest:#Exchange",
-            "Header": {
-                "__type": "JsonRequestHeaders:#Exchange",
-                "RequestServerVersion": "Exchange2013",
-            },
-            "Body": {
-                "__type": "FindItemRequest:#Exchange",
-                "ItemShape": {
-                    "__type": "ItemResponseShape:#Exchange",
-                    "BaseShape": "AllProperties",
+        # Step 2: Get events with item_ids via FindItem + CalendarView.
+        # CalendarView restricts results to the date range and expands recurring
+        # events into individual occurrences (each with its own ItemId).
+        folder_id = client.get_folder_id("calendar")
+        finditem_by_key: dict[str, _FIRow] = {}  # "subject|start" -> row
+        if folder_id:
+            cv_start = start_dt.strftime("%Y-%m-%dT00:00:00")
+            cv_end = (end_dt + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00")
+
+            payload = {
+                "__type": "FindItemJsonRequest:#Exchange",
+                "Header": {
+                    "__type": "JsonRequestHeaders:#Exchange",
+                    "RequestServerVersion": "Exchange2013",
                 },
-                "ParentFolderIds": [
-                    {"__type": "FolderId:#Exchange", "Id": folder_id}
-                ],
-                "Traversal": "Shallow",
-                "CalendarView": {
-                    "__type": "CalendarView:#Exchange",
-                    "StartDate": cv_start,
-                    "EndDate": cv_end,
+                "Body": {
+                    "__type": "FindItemRequest:#Exchange",
+                    "ItemShape": _CALENDAR_VIEW_SHAPE,
+                    "ParentFolderIds": [
+                        {"__type": "FolderId:#Exchange", "Id": folder_id}
+                    ],
+                    "Traversal": "Shallow",
+                    "CalendarView": {
+                        "__type": "CalendarView:#Exchange",
+                        "StartDate": cv_start,
+                        "EndDate": cv_end,
+                    },
                 },
-            },
-        }
-
-        data = client.request("FindItem", payload)
-
-        all_items = []
-        for msg in client.extract_items(data):
-            if "RootFolder" in msg:
-                all_items = msg["RootFolder"].get("Items", [])
-                break
-
-        # Index FindItem results by subject + normalized local start time.
-        # FindItem returns UTC timestamps (e.g. "2026-02-17T06:30:00Z"),
-        # while GetUserAvailability returns Moscow local time ("2026-02-17T09:30:00").
-        # Normalize FindItem timestamps to local time for matching.
-        for item in all_items:
-            subject = item.get("Subject", "")
-            start = item.get("Start", "")
-            local_start = _utc_to_local_str(start)
-            key = f"{subject}|{local_start}"
-            finditem_by_key[key] = item
-
-    # Step 3: Merge — use expanded list as the authoritative event list,
-    # enrich with FindItem data (item_id, details) when available
-    events = []
-    for ev in expanded:
-        subject = ev.get("subject", "(No subject)")
-        start = ev.get("start", "")
-        end = ev.get("end", "")
-        is_recurring = ev.get("is_recurring", False)
-
-        # Match expanded event (local time) with FindItem result (normalized to local)
-        fi_item = finditem_by_key.get(f"{subject}|{start}")
-
-        item_id = fi_item.get("ItemId", {}).get("Id", "") if fi_item else ""
-
-        event = {
-            "subject": subject,
-            "start": fi_item.get("Start", start) if fi_item else start,
-            "end": fi_item.get("End", end) if fi_item else end,
-            "location": ev.get("location", ""),
-            "is_all_day": fi_item.get("IsAllDayEvent", False) if fi_item else False,
-            "is_cancelled": fi_item.get("IsCancelled", False) if fi_item else False,
-            "is_meeting": ev.get("is_meeting", False),
-            "is_recurring": is_recurring,
-            "organizer": "",
-            "my_response": fi_item.get("MyResponseType", "") if fi_item else "",
-            "item_id": item_id,
-            "body": "",
-            "attendees_required": [],
-            "attendees_optional": [],
-        }
+            }
 
-        # Get full details via GetItem if requested and item_id is available
-        if include_body and item_id:
-            details = _get_event_details(client, item_id)
-            event["organizer"] = details["organizer"]
-            event["location"] = details["location"] or event["location"]
-            event["body"] = details["body"]
-            event["attendees_required"] = details["attendees_required"]
-            event["attendees_optional"] = details["attendees_optional"]
+            data = client.request("FindItem", payload)
+
+            all_items = []
+            for msg in client.extract_items(data):
+                if "RootFolder" in msg:
+                    all_items = msg["RootFolder"].get("Items", [])
+                    break
+
+            # Index FindItem results by subject + normalized local start time.
+            # FindItem returns UTC timestamps (e.g. "2026-02-17T06:30:00Z"),
+            # while GetUserAvailability returns Moscow local time ("2026-02-17T09:30:00").
+            # Normalize FindItem timestamps to local time for matching.
+            finditem_by_key = {
+                f"{item.get('Subject', '')}|{_utc_to_local_str(item.get('Start', ''))}":
+                    _finditem_row(item)
+                for item in all_items
+            }
 
-        events.append(event)
+        # Step 3: Merge — use expanded list as the authoritative event list,
+        # enrich with FindItem data (item_id, details) when available
+        expanded = expanded_future.result()
+
+    # Match expanded events (local time) with FindItem results (normalized to local)
+    finditem_get = finditem_by_key.get
+    events = [
+        _merge_event(ev, finditem_get(f"{ev.get('subject', '(No subject)')}|{ev.get('start', '')}"))
+        for ev in expanded
+    ]
+
+    # Get full details via GetItem (batched) if requested and item_id is available
+    if include_body:
+        item_ids = list(dict.fromkeys(event["item_id"] for event in events if event["item_id"]))
+        if item_ids:
+            change_keys = {
+                fi.item_id: fi.change_key for fi in finditem_by_key.values() if fi.item_id
+            }
+            all_details = _get_event_details_bulk(client, item_ids, change_keys)
+            for event in events:
+                details = all_details.get(event["item_id"])
+                if details is None:
+                    continue
+                event["organizer"] = details["organizer"]
+                event["location"] = details["location"] or event["location"]
+                event["body"] = details["body"]
+                event["attendees_required"] = details["attendees_required"]
+                event["attendees_optional"] = details["attendees_optional"]
 
-    return json.dumps(events, ensure_ascii=False)
+    return dumps_json(events)
 
 
 # ------------------------------------------------------------------
@@ -598,7 +1057,7 @@ def create_meeting(
         start_dt = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
         end_dt = start_dt + timedelta(minutes=duration_minutes)
     except ValueError as e:
-        return json.dumps({"error": f"Invalid date/time: {e}"})
+        return _error_json(f"Invalid date/time: {e}")
 
     # Resolve attendees
     resolved_required = _resolve_attendee_list(client, required_attendees or [])
@@ -607,87 +1066,28 @@ def create_meeting(
     # Build HTML body
     html_body = _build_html_body(description)
 
-    # Build location object
-    location_obj = {
-        "__type": "EnhancedLocation:#Exchange",
-        "Annotation": "",
-        "DisplayName": location or "",
-        "PostalAddress": {
-            "__type": "PersonaPostalAddress:#Exchange",
-            "Type": "Business",
-            "LocationSource": "None",
-        },
-    }
-
-    # Build calendar item
-    calendar_item = {
-        "__type": "CalendarItem:#Exchange",
-        "ClientSeriesId": str(uuid.uuid4()),
-        "Subject": subject,
-        "Body": {
-            "__type": "BodyContentType:#Exchange",
-            "BodyType": "HTML",
-            "Value": html_body,
-        },
-        "Sensitivity": sensitivity,
-        "ReminderIsSet": True,
-        "ReminderMinutesBeforeStart": reminder_minutes,
-        "IsResponseRequested": True,
-        "DoNotForwardMeeting": False,
-        "IsAllDayEvent": is_all_day,
-        "Start": start_dt.strftime("%Y-%m-%dT%H:%M:%S.000"),
-        "End": end_dt.strftime("%Y-%m-%dT%H:%M:%S.000"),
-        "FreeBusyType": "Busy",
-        "Location": location_obj,
-        "unfoldedIndex": 0,
-    }
-
-    if importance != "Normal":
-        calendar_item["Importance"] = importance
-
-    if resolved_required:
-        calendar_item["RequiredAttendees"] = resolved_required
-    if resolved_optional:
-        calendar_item["OptionalAttendees"] = resolved_optional
-
     # Build request - uses CreateCalendarEvent action and V2017_08_18
-    payload = {
-        "__type": "CreateItemJsonRequest:#Exchange",
-        "Header": {
-            "__type": "JsonRequestHeaders:#Exchange",
-            "RequestServerVersion": "V2017_08_18",
-            "TimeZoneContext": {
-                "__type": "TimeZoneContext:#Exchange",
-                "TimeZoneDefinition": {
-                    "__type": "TimeZoneDefinitionType:#Exchange",
-                    "Id": "Russian Standard Time",
-                },
-            },
-        },
-        "Body": {
-            "__type": "CreateItemRequest:#Exchange",
-            "Items": [calendar_item],
-            "ClientSupportsIrm": True,
-            "SavedItemFolderId": {
-                "__type": "TargetFolderId:#Exchange",
-                "BaseFolderId": {
-                    "__type": "DistinguishedFolderId:#Exchange",
-                    "Id": "calendar",
-                },
-            },
-        },
-    }
-
-    # Send invitations if there are attendees
-    if resolved_required or resolved_optional:
-        payload["Body"]["SendMeetingInvitations"] = "SendToAllAndSaveCopy"
+    payload = _build_create_event_payload(
+        subject=subject,
+        html_body=html_body,
+        sensitivity=sensitivity,
+        reminder_minutes=reminder_minutes,
+        is_all_day=is_all_day,
+        start=start_dt,
+        end=end_dt,
+        location=location or "",
+        required=resolved_required,
+        optional=resolved_optional,
+        importance=importance,
+    )
 
     data = client.request("CreateCalendarEvent", payload)
+    _invalidate_expanded_events(client)
 
     # Check for top-level error
     body = data.get("Body", {})
     if "ErrorCode" in body:
-        return json.dumps({"error": body.get("FaultMessage", "Unknown error")})
+        return _error_json(body.get("FaultMessage", "Unknown error"))
 
     # Check response messages
     items = body.get("ResponseMessages", {}).get("Items", [])
@@ -719,14 +1119,14 @@ def create_meeting(
                 result["optional_attendees"] = [
                     a["Mailbox"]["EmailAddress"] for a in resolved_optional
                 ]
-            return json.dumps(result, ensure_ascii=False)
+            return dumps_json(result)
         else:
-            return json.dumps({
+            return dumps_json({
                 "error": item.get("MessageText", "Unknown error"),
                 "response_code": item.get("ResponseCode", ""),
             })
 
-    return json.dumps({"success": True, "subject": subject, "note": "No confirmation details"})
+    return dumps_json({"success": True, "subject": subject, "note": "No confirmation details"})
 
 
 # ------------------------------------------------------------------
@@ -750,10 +1150,12 @@ def update_meeting(
 ) -> str:
     """Update an existing calendar meeting.
 
-    Internally cancels the old meeting and creates a new one with
-    updated fields, because OWA's JSON API does not support UpdateItem
-    for calendar items reliably. Unchanged fields are preserved from
-    the original meeting.
+    Changes the meeting in place with a single UpdateItem request and
+    sends the update to attendees. If Exchange reports that the changed
+    properties cannot be updated in place, falls back to cancelling the
+    old meeting and creating a new one with updated fields (unchanged
+    fields are preserved from the original meeting); the result then
+    carries the rejection as "fallback_reason".
 
     Args:
         item_id: The ItemId of the meeting to update (from get_calendar_events).
@@ -767,21 +1169,24 @@ def update_meeting(
             Replaces existing list. Omit to keep original attendees.
         optional_attendees: Email addresses for optional attendees.
             Replaces existing list. Omit to keep original attendees.
-        change_key: Ignored (kept for backward compatibility).
+        change_key: ChangeKey of the meeting (omit to use the current one).
 
     Returns:
         JSON object with update result including new item_id.
     """
     client = _get_client(ctx)
 
-    # Step 1: Get the original meeting details
-    try:
-        orig = _get_full_event(client, item_id)
-    except Exception as e:
-        return json.dumps({"error": f"Could not fetch original meeting: {e}"})
+    # Step 1: Get the original meeting details, unless the caller supplied
+    # everything the in-place update and the result need
+    orig: dict = {}
+    if subject is None or date is None or start_time is None or duration_minutes is None:
+        try:
+            orig = _get_full_event(client, item_id)
+        except Exception as e:
+            return _error_json(f"Could not fetch original meeting: {e}")
 
-    if "error" in orig:
-        return json.dumps(orig)
+        if "error" in orig:
+            return dumps_json(orig)
 
     # Step 2: Merge original values with updates
     new_subject = subject if subject is not None else orig.get("subject", "")
@@ -790,8 +1195,8 @@ def update_meeting(
     orig_start_str = orig.get("start", "")
     orig_end_str = orig.get("end", "")
     try:
-        orig_start = datetime.fromisoformat(orig_start_str.replace("Z", "+00:00")).replace(tzinfo=None)
-        orig_end = datetime.fromisoformat(orig_end_str.replace("Z", "+00:00")).replace(tzinfo=None)
+        orig_start = datetime.fromisoformat(orig_start_str.removesuffix("Z")).replace(tzinfo=None)
+        orig_end = datetime.fromisoformat(orig_end_str.removesuffix("Z")).replace(tzinfo=None)
         orig_duration = int((orig_end - orig_start).total_seconds() / 60)
     except (ValueError, AttributeError):
         orig_start = None
@@ -799,18 +1204,16 @@ def update_meeting(
         orig_duration = 30
 
     if date is not None and start_time is not None:
-        new_start = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
+        new_start = _parse_date(date, *_parse_hhmm(start_time))
         dur = duration_minutes if duration_minutes is not None else orig_duration
         new_end = new_start + timedelta(minutes=dur)
     elif date is not None and orig_start is not None:
-        new_start = datetime.strptime(date, "%Y-%m-%d").replace(
-            hour=orig_start.hour, minute=orig_start.minute
-        )
+        new_start = _parse_date(date, orig_start.hour, orig_start.minute)
         dur = duration_minutes if duration_minutes is not None else orig_duration
         new_end = new_start + timedelta(minutes=dur)
     elif start_time is not None and orig_start is not None:
-        parts = start_time.split(":")
-        new_start = orig_start.replace(hour=int(parts[0]), minute=int(parts[1]))
+        hour, minute = _parse_hhmm(start_time)
+        new_start = orig_start.replace(hour=hour, minute=minute)
         dur = duration_minutes if duration_minutes is not None else orig_duration
         new_end = new_start + timedelta(minutes=dur)
     elif duration_minutes is not None and orig_start is not None:
@@ -820,150 +1223,161 @@ def update_meeting(
         new_start = orig_start
         new_end = orig_end
     else:
-        return json.dumps({"error": "Cannot determine meeting time. Provide date and start_time."})
-
-    new_location = location if location is not None else orig.get("location", "")
+        return _error_json("Cannot determine meeting time. Provide date and start_time.")
 
     # Resolve attendees
+    resolved_required = None
     if required_attendees is not None:
         resolved_required = _resolve_attendee_list(client, required_attendees)
-    else:
-        resolved_required = orig.get("resolved_required", [])
 
+    resolved_optional = None
     if optional_attendees is not None:
         resolved_optional = _resolve_attendee_list(client, optional_attendees)
-    else:
-        resolved_optional = orig.get("resolved_optional", [])
 
-    # Step 3: Cancel the original meeting
-    cancel_payload = {
-        "__type": "DeleteItemJsonRequest:#Exchange",
-        "Header": {
-            "__type": "JsonRequestHeaders:#Exchange",
-            "RequestServerVersion": "Exchange2013",
-        },
-        "Body": {
-            "__type": "DeleteItemRequest:#Exchange",
-            "ItemIds": [
-                {"__type": "ItemId:#Exchange", "Id": item_id}
-            ],
-            "DeleteType": "MoveToDeletedItems",
-            "SendMeetingCancellations": "SendToAllAndSaveCopy",
-            "SuppressReadReceipts": True,
-        },
+    # Step 3: Update the meeting in place, sending only the changed fields
+    changed: dict = {}
+    if subject is not None:
+        changed["Subject"] = new_subject
+    if date is not None or start_time is not None or duration_minutes is not None:
+        changed["Start"] = _ews_datetime(new_start)
+        changed["End"] = _ews_datetime(new_end)
+    if location is not None:
+        changed["Location"] = {**_LOCATION_TEMPLATE, "DisplayName": location}
+    if description is not None:
+        changed["Body"] = {
+            "__type": "BodyContentType:#Exchange",
+            "BodyType": "HTML",
+            "Value": _build_html_body(description),
+        }
+    if resolved_required is not None:
+        changed["RequiredAttendees"] = resolved_required
+    if resolved_optional is not None:
+        changed["OptionalAttendees"] = resolved_optional
+
+    result = {
+        "success": True,
+        "subject": new_subject,
+        "start": new_start.isoformat(" ", "minutes"),
+        "end": new_end.isoformat(" ", "minutes"),
+        "duration_minutes": int((new_end - new_start).total_seconds() / 60),
     }
 
+    if not changed:
+        result["item_id"] = item_id
+        result["change_key"] = orig.get("change_key", "")
+        return dumps_json(result)
+
+    update_payload = _build_update_event_payload(
+        item_id, change_key or orig.get("change_key", ""), changed
+    )
+    # Transport and session failures are reported as-is: the update may have
+    # gone through, so cancelling and re-creating could duplicate the meeting
     try:
-        client.request("DeleteItem", cancel_payload)
+        data = client.request("UpdateItem", update_payload)
     except Exception as e:
-        return json.dumps({"error": f"Failed to cancel original meeting: {e}"})
-
-    # Step 4: Create the new meeting
-    new_body = description if description is not None else orig.get("body_html", "")
-    if description is not None:
-        new_body = _build_html_body(description)
+        return _error_json(f"Failed to update meeting: {e}")
+    finally:
+        _invalidate_expanded_events(client)
 
-    location_obj = {
-        "__type": "EnhancedLocation:#Exchange",
-        "Annotation": "",
-        "DisplayName": new_location,
-        "PostalAddress": {
-            "__type": "PersonaPostalAddress:#Exchange",
-            "Type": "Business",
-            "LocationSource": "None",
-        },
-    }
+    body = data.get("Body", {})
+    if "ErrorCode" in body:
+        return _error_json(body.get("FaultMessage", "Unknown error"))
+
+    msg = next(iter(client.extract_items(data)), None)
+    if msg is None:
+        return _error_json("No response from server")
+
+    if msg.get("ResponseClass") == "Success":
+        updated_items = msg.get("Items", [])
+        updated_id = updated_items[0].get("ItemId", {}) if updated_items else {}
+        result["item_id"] = updated_id.get("Id", item_id)
+        result["change_key"] = updated_id.get("ChangeKey", "")
+        return dumps_json(result)
+
+    if msg.get("ResponseCode") not in _UPDATE_UNSUPPORTED_CODES:
+        return dumps_json({
+            "error": msg.get("MessageText", "Unknown error"),
+            "response_code": msg.get("ResponseCode", ""),
+        })
 
-    calendar_item = {
-        "__type": "CalendarItem:#Exchange",
-        "ClientSeriesId": str(uuid.uuid4()),
-        "Subject": new_subject,
-        "Body": {
-            "__type": "BodyContentType:#Exchange",
-            "BodyType": "HTML",
-            "Value": new_body,
-        },
-        "Sensitivity": orig.get("sensitivity", "Normal"),
-        "ReminderIsSet": True,
-        "ReminderMinutesBeforeStart": 15,
-        "IsResponseRequested": True,
-        "DoNotForwardMeeting": False,
-        "IsAllDayEvent": orig.get("is_all_day", False),
-        "Start": new_start.strftime("%Y-%m-%dT%H:%M:%S.000"),
-        "End": new_end.strftime("%Y-%m-%dT%H:%M:%S.000"),
-        "FreeBusyType": "Busy",
-        "Location": location_obj,
-        "unfoldedIndex": 0,
-    }
+    # Step 4: Exchange refused to change these properties in place, so fall
+    # back to re-creating the meeting, which needs every field of the original
+    result["fallback_reason"] = msg.get("MessageText", "")
+    if not orig:
+        try:
+            orig = _get_full_event(client, item_id)
+        except Exception as e:
+            return _error_json(f"Could not fetch original meeting: {e}")
 
-    if resolved_required:
-        calendar_item["RequiredAttendees"] = resolved_required
-    if resolved_optional:
-        calendar_item["OptionalAttendees"] = resolved_optional
+        if "error" in orig:
+            return dumps_json(orig)
 
-    create_payload = {
-        "__type": "CreateItemJsonRequest:#Exchange",
-        "Header": {
-            "__type": "JsonRequestHeaders:#Exchange",
-            "RequestServerVersion": "V2017_08_18",
-            "TimeZoneContext": {
-                "__type": "TimeZoneContext:#Exchange",
-                "TimeZoneDefinition": {
-                    "__type": "TimeZoneDefinitionType:#Exchange",
-                    "Id": "Russian Standard Time",
-                },
-            },
-        },
-        "Body": {
-            "__type": "CreateItemRequest:#Exchange",
-            "Items": [calendar_item],
-            "ClientSupportsIrm": True,
-            "SavedItemFolderId": {
-                "__type": "TargetFolderId:#Exchange",
-                "BaseFolderId": {
-                    "__type": "DistinguishedFolderId:#Exchange",
-                    "Id": "calendar",
-                },
-            },
-        },
-    }
+    new_location = location if location is not None else orig.get("location", "")
+    if resolved_required is None:
+        resolved_required = orig.get("resolved_required", [])
+    if resolved_optional is None:
+        resolved_optional = orig.get("resolved_optional", [])
+    if description is not None:
+        new_body = _build_html_body(description)
+    else:
+        new_body = orig.get("body_html", "")
 
-    if resolved_required or resolved_optional:
-        create_payload["Body"]["SendMeetingInvitations"] = "SendToAllAndSaveCopy"
+    # Cancel the original meeting...
+    try:
+        client.request("DeleteItem", _cancel_meetings_payload([item_id]))
+    except Exception as e:
+        return _error_json(f"Failed to cancel original meeting: {e}")
+    finally:
+        _invalidate_expanded_events(client)
+
+    # ...and creating a new one
+    create_payload = _build_create_event_payload(
+        subject=new_subject,
+        html_body=new_body,
+        sensitivity=orig.get("sensitivity", "Normal"),
+        reminder_minutes=15,
+        is_all_day=orig.get("is_all_day", False),
+        start=new_start,
+        end=new_end,
+        location=new_location,
+        required=resolved_required,
+        optional=resolved_optional,
+    )
 
     try:
         data = client.request("CreateCalendarEvent", create_payload)
     except Exception as e:
-        return json.dumps({"error": f"Original cancelled but failed to create new: {e}"})
+        return _error_json(f"Original cancelled but failed to create new: {e}")
+    finally:
+        _invalidate_expanded_events(client)
 
     body = data.get("Body", {})
     if "ErrorCode" in body:
-        return json.dumps({"error": body.get("FaultMessage", "Unknown error")})
+        return _error_json(body.get("FaultMessage", "Unknown error"))
 
     resp_items = body.get("ResponseMessages", {}).get("Items", [])
     if resp_items and resp_items[0].get("ResponseClass") == "Success":
-        result = {
-            "success": True,
-            "subject": new_subject,
-            "start": new_start.strftime("%Y-%m-%d %H:%M"),
-            "end": new_end.strftime("%Y-%m-%d %H:%M"),
-            "duration_minutes": int((new_end - new_start).total_seconds() / 60),
-        }
         created_items = resp_items[0].get("Items", [])
         if created_items:
             new_item_id = created_items[0].get("ItemId", {})
             if new_item_id:
                 result["item_id"] = new_item_id.get("Id", "")
                 result["change_key"] = new_item_id.get("ChangeKey", "")
-        return json.dumps(result, ensure_ascii=False)
+        return dumps_json(result)
 
     if resp_items:
-        return json.dumps({
+        return dumps_json({
             "error": resp_items[0].get("MessageText", "Unknown error"),
             "response_code": resp_items[0].get("ResponseCode", ""),
+            "fallback_reason": result["fallback_reason"],
         })
 
-    return json.dumps({"success": True, "subject": new_subject, "note": "No confirmation details"})
+    return dumps_json({
+        "success": True,
+        "subject": new_subject,
+        "note": "No confirmation details",
+        "fallback_reason": result["fallback_reason"],
+    })
 
 
 # ------------------------------------------------------------------
@@ -971,6 +1385,31 @@ def update_meeting(
 # ------------------------------------------------------------------
 
 
+def _cancel_meeting_items(client: OWAClient, item_ids: list[str]) -> tuple[dict, list[dict]]:
+    """Cancel meetings with one DeleteItem request.
+
+    Returns the raw response and its response messages (one per id, in order).
+    """
+    data = client.request("DeleteItem", _cancel_meetings_payload(item_ids))
+    _invalidate_expanded_events(client)
+    return data, client.extract_items(data)
+
+
+def _item_results(item_ids: list[str], items: list[dict]) -> list[dict]:
+    """Pair each input id with the success/error of its response message."""
+    results = []
+    for item_id, item in zip(item_ids, items):
+        if item.get("ResponseClass") == "Success":
+            results.append({"item_id": item_id, "success": True})
+        else:
+            results.append({
+                "item_id": item_id,
+                "error": item.get("MessageText", "Unknown error"),
+                "response_code": item.get("ResponseCode", ""),
+            })
+    return results
+
+
 @mcp.tool()
 def cancel_meeting(
     item_id: str,
@@ -988,32 +1427,13 @@ def cancel_meeting(
     """
     client = _get_client(ctx)
 
-    payload = {
-        "__type": "DeleteItemJsonRequest:#Exchange",
-        "Header": {
-            "__type": "JsonRequestHeaders:#Exchange",
-            "RequestServerVersion": "Exchange2013",
-        },
-        "Body": {
-            "__type": "DeleteItemRequest:#Exchange",
-            "ItemIds": [
-                {"__type": "ItemId:#Exchange", "Id": item_id}
-            ],
-            "DeleteType": "MoveToDeletedItems",
-            "SendMeetingCancellations": "SendToAllAndSaveCopy",
-            "SuppressReadReceipts": True,
-        },
-    }
-
-    data = client.request("DeleteItem", payload)
-
-    items = client.extract_items(data)
+    data, items = _cancel_meeting_items(client, [item_id])
     if items:
         item = items[0]
         if item.get("ResponseClass") == "Success":
-            return json.dumps({"success": True, "message": "Meeting cancelled"})
+            return dumps_json({"success": True, "message": "Meeting cancelled"})
         else:
-            return json.dumps({
+            return dumps_json({
                 "error": item.get("MessageText", "Unknown error"),
                 "response_code": item.get("ResponseCode", ""),
             })
@@ -1021,62 +1441,82 @@ def cancel_meeting(
     # DeleteItem may return empty on success
     body = data.get("Body", {})
     if "ErrorCode" in body:
-        return json.dumps({"error": body.get("FaultMessage", "Unknown error")})
-
-    return json.dumps({"success": True, "message": "Meeting cancelled"})
+        return dumps_json({"error": body.get("FaultMessage", "Unknown error")})
 
-
-# ------------------------------------------------------------------
-# Tool 5: respond_to_meeting
-# ------------------------------------------------------------------
+    return dumps_json({"success": True, "message": "Meeting cancelled"})
 
 
 @mcp.tool()
-def respond_to_meeting(
-    item_id: str,
-    response: str,
-    message: str | None = None,
+def cancel_meetings(
+    item_ids: list[str],
     ctx: Context = None,
 ) -> str:
-    """Respond to a meeting invitation (accept, decline, or tentative).
+    """Cancel (delete) several calendar meetings in one request and notify attendees.
 
     Args:
-        item_id: The ItemId of the meeting to respond to.
-        response: Response type: "Accept", "Decline", or "Tentative".
-        message: Optional message to include with the response.
+        item_ids: ItemIds of the meetings to cancel.
 
     Returns:
-        JSON object with response result.
+        JSON object with overall success and a per-meeting results list.
     """
     client = _get_client(ctx)
 
-    # Map response to the correct __type
-    response_types = {
-        "Accept": "AcceptItem:#Exchange",
-        "Decline": "DeclineItem:#Exchange",
-        "Tentative": "TentativelyAcceptItem:#Exchange",
-    }
+    if not item_ids:
+        return dumps_json({"success": True, "message": "Cancelled 0 meeting(s)", "results": []})
 
-    response_type = response_types.get(response)
-    if not response_type:
-        return json.dumps({
-            "error": f"Invalid response: {response}. Must be Accept, Decline, or Tentative."
-        })
+    data, items = _cancel_meeting_items(client, item_ids)
+    if not items:
+        # DeleteItem may return empty on success
+        body = data.get("Body", {})
+        if "ErrorCode" in body:
+            return dumps_json({"error": body.get("FaultMessage", "Unknown error")})
+        results = [{"item_id": item_id, "success": True} for item_id in item_ids]
+    else:
+        results = _item_results(item_ids, items)
 
-    response_item = {
-        "__type": response_type,
-        "ReferenceItemId": {
-            "__type": "ItemId:#Exchange",
-            "Id": item_id,
-        },
-    }
+    cancelled = sum(1 for result in results if result.get("success"))
+    return dumps_json({
+        "success": cancelled == len(item_ids),
+        "message": f"Cancelled {cancelled} of {len(item_ids)} meeting(s)",
+        "results": results,
+    })
 
-    if message:
-        response_item["Body"] = {
-            "__type": "BodyContentType:#Exchange",
-            "BodyType": "Text",
-            "Value": message,
+
+# ------------------------------------------------------------------
+# Tool 5: respond_to_meeting
+# ------------------------------------------------------------------
+
+# Meeting response -> CreateItem response item __type
+_RESPONSE_TYPES = {
+    "Accept": "AcceptItem:#Exchange",
+    "Decline": "DeclineItem:#Exchange",
+    "Tentative": "TentativelyAcceptItem:#Exchange",
+}
+
+
+def _send_meeting_responses(
+    client: OWAClient, item_ids: list[str], response_type: str, message: str | None
+) -> list[dict]:
+    """Send one response item per meeting with a single CreateItem request.
+
+    Returns the response messages (one per id, in order).
+    """
+    response_items = []
+    for item_id in item_ids:
+        response_item = {
+            "__type": response_type,
+            "ReferenceItemId": {
+                "__type": "ItemId:#Exchange",
+                "Id": item_id,
+            },
         }
+        if message:
+            response_item["Body"] = {
+                "__type": "BodyContentType:#Exchange",
+                "BodyType": "Text",
+                "Value": message,
+            }
+        response_items.append(response_item)
 
     payload = {
         "__type": "CreateItemJsonRequest:#Exchange",
@@ -1086,29 +1526,97 @@ def respond_to_meeting(
         },
         "Body": {
             "__type": "CreateItemRequest:#Exchange",
-            "Items": [response_item],
+            "Items": response_items,
             "MessageDisposition": "SendAndSaveCopy",
         },
     }
 
     data = client.request("CreateItem", payload)
+    _invalidate_expanded_events(client)
+    return client.extract_items(data)
 
-    items = client.extract_items(data)
+
+@mcp.tool()
+def respond_to_meeting(
+    item_id: str,
+    response: str,
+    message: str | None = None,
+    ctx: Context = None,
+) -> str:
+    """Respond to a meeting invitation (accept, decline, or tentative).
+
+    Args:
+        item_id: The ItemId of the meeting to respond to.
+        response: Response type: "Accept", "Decline", or "Tentative".
+        message: Optional message to include with the response.
+
+    Returns:
+        JSON object with response result.
+    """
+    client = _get_client(ctx)
+
+    response_type = _RESPONSE_TYPES.get(response)
+    if not response_type:
+        return dumps_json({
+            "error": f"Invalid response: {response}. Must be Accept, Decline, or Tentative."
+        })
+
+    items = _send_meeting_responses(client, [item_id], response_type, message)
     if items:
         item = items[0]
         if item.get("ResponseClass") == "Success":
-            return json.dumps({
+            return dumps_json({
                 "success": True,
                 "response": response,
                 "message": f"Meeting {response.lower()}ed",
             })
         else:
-            return json.dumps({
+            return dumps_json({
                 "error": item.get("MessageText", "Unknown error"),
                 "response_code": item.get("ResponseCode", ""),
             })
 
-    return json.dumps({"error": "No response from server"})
+    return dumps_json({"error": "No response from server"})
+
+
+@mcp.tool()
+def respond_to_meetings(
+    item_ids: list[str],
+    response: str,
+    message: str | None = None,
+    ctx: Context = None,
+) -> str:
+    """Respond to several meeting invitations in one request.
+
+    Args:
+        item_ids: ItemIds of the meetings to respond to.
+        response: Response type for all of them: "Accept", "Decline", or "Tentative".
+        message: Optional message to include with each response.
+
+    Returns:
+        JSON object with overall success and a per-meeting results list.
+    """
+    client = _get_client(ctx)
+
+    response_type = _RESPONSE_TYPES.get(response)
+    if not response_type:
+        return dumps_json({
+            "error": f"Invalid response: {response}. Must be Accept, Decline, or Tentative."
+        })
+
+    if not item_ids:
+        return dumps_json({"success": True, "response": response, "results": []})
+
+    items = _send_meeting_responses(client, item_ids, response_type, message)
+    if not items:
+        return dumps_json({"error": "No response from server"})
+
+    results = _item_results(item_ids, items)
+    return dumps_json({
+        "success": all(result.get("success") for result in results),
+        "response": response,
+        "results": results,
+    })
 
 
 # ------------------------------------------------------------------
@@ -1128,31 +1636,11 @@ def download_event_attachments(
         item_id: The Exchange ItemId of the calendar event.
         target_folder: Local directory to save files (default /tmp/attachments).
     """
-    import os
-
     try:
         client = _get_client(ctx)
 
-        # Get full event details (AllProperties includes Attachments)
-        payload = {
-            "__type": "GetItemJsonRequest:#Exchange",
-            "Header": {
-                "__type": "JsonRequestHeaders:#Exchange",
-                "RequestServerVersion": "Exchange2013",
-            },
-            "Body": {
-                "__type": "GetItemRequest:#Exchange",
-                "ItemShape": {
-                    "__type": "ItemResponseShape:#Exchange",
-                    "BaseShape": "AllProperties",
-                },
-                "ItemIds": [
-                    {"__type": "ItemId:#Exchange", "Id": item_id}
-                ],
-            },
-        }
-
-        data = client.request("GetItem", payload)
+        # Get the event's attachment list
+        data = client.request("GetItem", _get_item_payload([item_id], _ATTACHMENTS_SHAPE))
 
         # Extract attachments from the item
         attachments = []
@@ -1171,7 +1659,7 @@ def download_event_attachments(
                 break
 
         if not attachments:
-            return json.dumps({"success": True, "downloaded": [], "count": 0,
+            return dumps_json({"success": True, "downloaded": [], "count": 0,
                                "message": "No attachments found on this event."})
 
         # Filter to non-inline file attachments
@@ -1181,58 +1669,104 @@ def download_event_attachments(
         ]
 
         if not file_attachments:
-            return json.dumps({"success": True, "downloaded": [], "count": 0,
+            return dumps_json({"success": True, "downloaded": [], "count": 0,
                                "message": "No downloadable file attachments."})
 
         os.makedirs(target_folder, exist_ok=True)
 
         downloaded = []
         errors = []
-        used_names: set[str] = set()
-
-        for att in file_attachments:
+        # Temporary files not yet moved into place; whatever is still here
+        # once we are done (or bail out) gets removed
+        pending: set[str] = set()
+
+        def fetch(att: dict) -> tuple[str, int, str, str] | Exception:
+            # The final name comes from the response headers, so stream into
+            # a temporary file first and move it into place afterwards. It is
+            # created with open() rather than mkstemp() so it gets the usual
+            # umask-based mode instead of 0600; "x" keeps the name unique.
+            tmp_path = os.path.join(target_folder, f".{uuid.uuid4().hex}.part")
             try:
-                content, filename, content_type = client.download_file(
-                    att["attachment_id"]
+                open(tmp_path, "xb").close()
+                pending.add(tmp_path)
+                size, filename, content_type = client.download_file_to(
+                    att["attachment_id"], Path(tmp_path)
                 )
+            except Exception as e:
+                return e
+            return tmp_path, size, filename, content_type
 
-                # Sanitize filename
-                filename = os.path.basename(filename)
-                if not filename:
-                    filename = att.get("name", "attachment") or "attachment"
-
-                # Handle collisions
-                base_name = filename
-                name_part, _, ext_part = base_name.rpartition(".")
-                if not name_part:
-                    name_part = base_name
-                    ext_part = ""
-
-                counter = 1
-                while filename.lower() in used_names:
-                    if ext_part:
-                        filename = f"{name_part}_{counter}.{ext_part}"
+        try:
+            # Downloads are independent, so overlap their round-trips; names
+            # are then assigned in input order so collision suffixes are stable
+            with ThreadPoolExecutor(
+                max_workers=min(_LOOKUP_CONCURRENCY, len(file_attachments))
+            ) as pool:
+                fetched = list(pool.map(fetch, file_attachments))
+
+            # Lowercased name -> next numeric suffix to try for it
+            name_counts: dict[str, int] = {}
+
+            for att, outcome in zip(file_attachments, fetched):
+                if isinstance(outcome, Exception):
+                    errors.append({
+                        "name": att.get("name", "unknown"),
+                        "error": str(outcome),
+                    })
+                    continue
+                tmp_path, size, filename, content_type = outcome
+
+                try:
+                    # Sanitize filename
+                    filename = os.path.basename(filename)
+                    if not filename:
+                        filename = att.get("name", "attachment") or "attachment"
+
+                    # Handle collisions
+                    base_name = filename
+                    name_part, _, ext_part = base_name.rpartition(".")
+                    if not name_part:
+                        name_part = base_name
+                        ext_part = ""
+
+                    key = base_name.lower()
+                    counter = name_counts.get(key)
+                    if counter is None:
+                        name_counts[key] = 1
                     else:
-                        filename = f"{name_part}_{counter}"
-                    counter += 1
-
-                used_names.add(filename.lower())
-
-                filepath = os.path.join(target_folder, filename)
-                with open(filepath, "wb") as f:
-                    f.write(content)
-
-                downloaded.append({
-                    "name": filename,
-                    "path": filepath,
-                    "size": len(content),
-                    "content_type": content_type,
-                })
-            except Exception as e:
-                errors.append({
-                    "name": att.get("name", "unknown"),
-                    "error": str(e),
-                })
+                        # Skip suffixes already taken, e.g. by a real "a_1.txt"
+                        while True:
+                            if ext_part:
+                                filename = f"{name_part}_{counter}.{ext_part}"
+                            else:
+                                filename = f"{name_part}_{counter}"
+                            counter += 1
+                            if filename.lower() not in name_counts:
+                                break
+                        name_counts[key] = counter
+                        name_counts[filename.lower()] = 1
+
+                    filepath = os.path.join(target_folder, filename)
+                    os.replace(tmp_path, filepath)
+                    pending.discard(tmp_path)
+
+                    downloaded.append({
+                        "name": filename,
+                        "path": filepath,
+                        "size": size,
+                        "content_type": content_type,
+                    })
+                except Exception as e:
+                    errors.append({
+                        "name": att.get("name", "unknown"),
+                        "error": str(e),
+                    })
+        finally:
+            for tmp_path in pending:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
         result = {
             "success": len(errors) == 0,
@@ -1242,10 +1776,10 @@ def download_event_attachments(
         if errors:
             result["errors"] = errors
 
-        return json.dumps(result)
+        return dumps_json(result)
 
     except Exception as e:
-        return json.dumps({"error": f"Failed to download event attachments: {e}"})
+        return dumps_json({"error": f"Failed to download event attachments: {e}"})
 
 
 # ------------------------------------------------------------------
@@ -1307,7 +1841,7 @@ def get_event_links(
                 links = extract_links_from_html(body_val)
                 break
 
-        return json.dumps({
+        return dumps_json({
             "item_id": item_id,
             "subject": subject,
             "links": links,
@@ -1315,4 +1849,4 @@ def get_event_links(
         })
 
     except Exception as e:
-        return json.dumps({"error": f"Failed to extract event links: {e}"})
+        return dumps_json({"error": f"Failed to extract event links: {e}"})
@@ -212,6 +212,9 @@ def create_folder(
     except Exception as e:
         return json.dumps({"error": str(e)})
 
+    # Folder names/IDs may have changed; drop cached name lookups
+    client.clear_folder_cache()
+
     for msg in client.extract_items(data):
         if "Folders" in msg:
             folder = msg["Folders"][0]
@@ -276,6 +279,9 @@ def rename_folder(
     except Exception as e:
         return json.dumps({"error": str(e)})
 
+    # Folder names/IDs may have changed; drop cached name lookups
+    client.clear_folder_cache()
+
     for msg in client.extract_items(data):
         if "Folders" in msg:
             folder = msg["Folders"][0]
@@ -373,6 +379,9 @@ def delete_folder(
     except Exception as e:
         return json.dumps({"error": str(e)})
 
+    # Folder names/IDs may have changed; drop cached name lookups
+    client.clear_folder_cache()
+
     for msg in client.extract_items(data):
         if msg.get("ResponseClass") == "Success":
             return json.dumps({"success": True, "folder_id": folder_id})
@@ -419,6 +428,9 @@ def move_folder(
     except Exception as e:
         return json.dumps({"error": str(e)})
 
+    # Folder names/IDs may have changed; drop cached name lookups
+    client.clear_folder_cache()
+
     for msg in client.extract_items(data):
         if "Folders" in msg:
             folder = msg["Folders"][0]
@@ -1,13 +1,38 @@
 """Shared utility functions for the Exchange MCP server.
 
 Extracts duplicated helpers from the standalone scripts:
-html_to_text, date/time formatting and parsing.
+html_to_text, date/time formatting and parsing, JSON output.
 """
 
 import html
+import json
 import re
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional speedup; the regex link scanner is used otherwise
+    LexborHTMLParser = None
+
+# Stdlib fallback for dumps_json: one shared encoder (json.dumps builds a new
+# one per call for non-default options), compact like orjson
+_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def dumps_json(obj) -> str:
+    """Serialize a tool result to a compact JSON string, keeping non-ASCII as-is.
+
+    Uses orjson when installed, else a shared stdlib JSONEncoder.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return _json_encode(obj)
+
 
 def html_to_text(html_content: str) -> str:
     """Convert HTML to plain text.
@@ -45,17 +70,13 @@ def extract_links_from_html(html_content: str) -> list[dict]:
     if not html_content:
         return []
 
-    # Match <a ...href="URL"...>text</a>
-    pattern = re.compile(
-        r'<a\s[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>',
-        re.DOTALL | re.IGNORECASE,
-    )
-
     seen: set[str] = set()
     links: list[dict] = []
 
-    for url_raw, text_raw in pattern.findall(html_content):
-        url = html.unescape(url_raw).strip()
+    for url, text in _iter_anchors(html_content):
+        url = url.strip()
+        if not url:
+            continue
 
         # Skip non-http links
         if url.startswith(("mailto:", "cid:", "javascript:")) or url == "#":
@@ -68,15 +89,33 @@ def extract_links_from_html(html_content: str) -> list[dict]:
             continue
         seen.add(url)
 
-        # Clean link text: strip tags and whitespace
-        text = re.sub(r"<[^>]+>", "", text_raw)
-        text = html.unescape(text).strip()
-
-        links.append({"url": url, "text": text})
+        links.append({"url": url, "text": text.strip()})
 
     return links
 
 
+# Match <a ...href="URL"...>text</a>
+_ANCHOR_RE = re.compile(
+    r'<a\s[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>',
+    re.DOTALL | re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _iter_anchors(html_content: str):
+    """Yield (href, text) for each link, entity-decoded and with tags stripped.
+
+    Parses with selectolax when installed, else scans with a regex.
+    """
+    if LexborHTMLParser is not None:
+        for node in LexborHTMLParser(html_content).css("a[href]"):
+            yield node.attributes.get("href") or "", node.text()
+        return
+
+    for url_raw, text_raw in _ANCHOR_RE.findall(html_content):
+        yield html.unescape(url_raw), html.unescape(_TAG_RE.sub("", text_raw))
+
+
 def format_datetime(dt_str: str) -> str:
     """Format an ISO datetime string as 'YYYY-MM-DD HH:MM'.
 
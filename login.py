@@ -7,58 +7,24 @@ Approve login via 2FA mobile app.
 import sys
 import os
 import time
-import base64
 import getpass
 from pathlib import Path
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
-CREDS_FILE = Path(__file__).parent / ".credentials.enc"
-SALT_FILE = Path(__file__).parent / ".salt"
-
-def get_key(password: str, salt: bytes) -> bytes:
-    """Derive encryption key from password"""
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=480000,
-    )
-    return base64.urlsafe_b64encode(kdf.derive(password.encode()))
+from exchange_mcp._crypto import CREDS_FILE, SALT_FILE
+from exchange_mcp._crypto import encrypt_credentials as _encrypt_credentials
+from exchange_mcp._crypto import decrypt_credentials as _decrypt_credentials
 
 def encrypt_credentials(username: str, password: str, master_password: str):
     """Encrypt and save credentials"""
-    salt = os.urandom(16)
-    key = get_key(master_password, salt)
-    f = Fernet(key)
-    
-    data = f"{username}:{password}".encode()
-    encrypted = f.encrypt(data)
-    
-    SALT_FILE.write_bytes(salt)
-    CREDS_FILE.write_bytes(encrypted)
-    os.chmod(SALT_FILE, 0o600)
-    os.chmod(CREDS_FILE, 0o600)
+    _encrypt_credentials(username, password, master_password)
     print("Credentials encrypted and saved.")
 
 def decrypt_credentials(master_password: str) -> tuple:
     """Decrypt and return credentials"""
-    if not CREDS_FILE.exists() or not SALT_FILE.exists():
-        return None, None
-    
-    salt = SALT_FILE.read_bytes()
-    encrypted = CREDS_FILE.read_bytes()
-    key = get_key(master_password, salt)
-    f = Fernet(key)
-    
-    try:
-        data = f.decrypt(encrypted).decode()
-        username, password = data.split(":", 1)
-        return username, password
-    except:
+    username, password = _decrypt_credentials(master_password)
+    if username is None and CREDS_FILE.exists() and SALT_FILE.exists():
         print("ERROR: Invalid master password!")
-        return None, None
+    return username, password
 
 def setup_credentials():
     """Interactive setup of credentials"""
@@ -171,14 +137,11 @@ def login(username: str, password: str, master_password: str = None):
             cookies = context.cookies()
             cookie_file = Path(__file__).parent / "session-cookies.txt"
             cookies_str = "\n".join(
-                f"{c['name']}={c['value']}" for c in cookies
+                [f"{c['name']}={c['value']}" for c in cookies]
             )
             if master_password and SALT_FILE.exists():
-                salt = SALT_FILE.read_bytes()
-                key = get_key(master_password, salt)
-                f = Fernet(key)
-                cookie_file.write_bytes(f.encrypt(cookies_str.encode()))
-                os.chmod(cookie_file, 0o600)
+                from exchange_mcp.auth import encrypt_cookie_file
+                encrypt_cookie_file(cookies_str, master_password, cookie_file)
                 print(f"Encrypted cookies saved to {cookie_file}", flush=True)
             else:
                 with open(cookie_file, 'w') as f: